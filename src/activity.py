@@ -74,6 +74,10 @@ class Activity:
             for row in reader:
                 self.transactions.append(ActivityTransaction.from_csv_row(row))
 
+        # Keep transactions sorted by (settlement date, basket) so downstream
+        # grouping (e.g. journal entry generation) does not need to re-sort.
+        self.transactions.sort(key=lambda t: (t.settlement_date, t.basket or ''))
+
     def __len__(self) -> int:
         """Return the number of activity transactions."""
         return len(self.transactions)
@@ -75,6 +75,10 @@ class Income:
             for row in reader:
                 self.transactions.append(IncomeTransaction.from_csv_row(row))
 
+        # Keep transactions sorted by settlement date so downstream grouping
+        # (e.g. journal entry generation) does not need to re-sort per call.
+        self.transactions.sort(key=lambda t: t.settlement_date)
+
     @property
     def amount(self) -> float:
         """Calculate total amount across all income transactions, excluding reinvestments."""
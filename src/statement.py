@@ -9,6 +9,12 @@ from .activity import Activity
 from .summary import Summary
 
 
+# Parsed chart-of-accounts symbol maps keyed by (path, mtime_ns). The chart is
+# stable across runs, so repeated loads within a process reuse the parsed dict
+# and re-parse only when the file changes on disk.
+_chart_of_accounts_cache: dict = {}
+
+
 class Statement:
     """
     Manages all scrape data for a single statement period.
@@ -165,6 +171,11 @@ class Statement:
         if not chart_path.exists():
             return symbol_map
 
+        cache_key = (str(chart_path), chart_path.stat().st_mtime_ns)
+        cached = _chart_of_accounts_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         with open(chart_path, 'r', encoding='utf-8') as f:
             reader = csv.DictReader(f)
             for row in reader:
@@ -176,6 +187,10 @@ class Statement:
                     symbol = account_name[start+1:end]
                     symbol_map[symbol] = account_name
 
+        # Keep only the current version of the chart in the cache
+        _chart_of_accounts_cache.clear()
+        _chart_of_accounts_cache[cache_key] = symbol_map
+
         return symbol_map
 
     def _get_entry_path(self, entry_type: str) -> Path:
@@ -203,14 +218,18 @@ class Statement:
         if self.income is None:
             return None
 
-        from collections import defaultdict
+        from itertools import groupby
         import csv
 
-        # Group non-reinvestment income transactions by date
-        income_by_date = defaultdict(list)
-        for txn in self.income:
-            if not txn.is_reinvestment:
-                income_by_date[txn.settlement_date].append(txn)
+        # Group non-reinvestment income transactions by date. Transactions are
+        # already sorted by settlement date at load time, so no re-sort needed.
+        income_by_date = [
+            (settlement_date, list(txns))
+            for settlement_date, txns in groupby(
+                (t for t in self.income if not t.is_reinvestment),
+                key=lambda t: t.settlement_date
+            )
+        ]
 
         if not income_by_date:
             return None
@@ -224,8 +243,8 @@ class Statement:
 
             journal_number = 10001
 
-            for settlement_date in sorted(income_by_date.keys()):
-                txns = income_by_date[settlement_date]
+            for settlement_date, txns in income_by_date:
+                jn_str = str(journal_number)
                 ref_number = f"DIV-{settlement_date}"
                 symbols = ', '.join(sorted(set(t.symbol for t in txns)))
                 notes = f"{settlement_date} Dividends - {symbols}"
@@ -236,7 +255,7 @@ class Statement:
                         'Journal Date': str(settlement_date),
                         'Reference Number': ref_number,
                         'Journal Number Prefix': 'MMW-',
-                        'Journal Number Suffix': str(journal_number),
+                        'Journal Number Suffix': jn_str,
                         'Notes': notes,
                         'Journal Type': 'both',
                         'Currency': 'USD',
@@ -254,7 +273,7 @@ class Statement:
                     'Journal Date': str(settlement_date),
                     'Reference Number': ref_number,
                     'Journal Number Prefix': 'MMW-',
-                    'Journal Number Suffix': str(journal_number),
+                    'Journal Number Suffix': jn_str,
                     'Notes': notes,
                     'Journal Type': 'both',
                     'Currency': 'USD',
@@ -277,16 +296,21 @@ class Statement:
         if self.activity is None:
             return None
 
-        from collections import defaultdict
+        from itertools import groupby
         import csv
 
         money_market_symbols = {'FDRXX', 'SPAXX', 'FCASH'}
-        purchases_by_date_basket = defaultdict(list)
 
-        for txn in self.activity:
-            if 'Bought' in txn.action and txn.symbol not in money_market_symbols:
-                key = (txn.settlement_date, txn.basket or '')
-                purchases_by_date_basket[key].append(txn)
+        # Transactions are pre-sorted by (settlement date, basket) at load
+        # time, so grouping needs only a single linear pass.
+        purchases_by_date_basket = [
+            (key, list(txns))
+            for key, txns in groupby(
+                (t for t in self.activity
+                 if 'Bought' in t.action and t.symbol not in money_market_symbols),
+                key=lambda t: (t.settlement_date, t.basket or '')
+            )
+        ]
 
         if not purchases_by_date_basket:
             return None
@@ -301,7 +325,8 @@ class Statement:
 
             journal_number = 20001
 
-            for (settlement_date, basket), txns in sorted(purchases_by_date_basket.items()):
+            for (settlement_date, basket), txns in purchases_by_date_basket:
+                jn_str = str(journal_number)
                 basket_suffix = f"-{basket}" if basket else ""
                 ref_number = f"PUR-{settlement_date}{basket_suffix}"
                 symbols = ', '.join(sorted(set(t.symbol for t in txns)))
@@ -319,7 +344,7 @@ class Statement:
                         'Journal Date': str(settlement_date),
                         'Reference Number': ref_number,
                         'Journal Number Prefix': 'MMW-',
-                        'Journal Number Suffix': str(journal_number),
+                        'Journal Number Suffix': jn_str,
                         'Notes': notes,
                         'Journal Type': 'both',
                         'Currency': 'USD',
@@ -337,7 +362,7 @@ class Statement:
                     'Journal Date': str(settlement_date),
                     'Reference Number': ref_number,
                     'Journal Number Prefix': 'MMW-',
-                    'Journal Number Suffix': str(journal_number),
+                    'Journal Number Suffix': jn_str,
                     'Notes': notes,
                     'Journal Type': 'both',
                     'Currency': 'USD',
@@ -361,10 +386,10 @@ class Statement:
             return None
 
         from collections import defaultdict
+        from itertools import groupby
         import csv
 
         money_market_symbols = {'FDRXX', 'SPAXX', 'FCASH'}
-        sales_by_date_basket = defaultdict(list)
 
         # Basket config for realized gains/losses income account
         basket_income_accounts = {
@@ -374,10 +399,16 @@ class Statement:
             '10007': ('Balanced ETFs', 'Income - Equity Securities Baskets - Balanced ETFs'),
         }
 
-        for txn in self.activity:
-            if 'Sold' in txn.action and txn.symbol not in money_market_symbols:
-                key = (txn.settlement_date, txn.basket or '')
-                sales_by_date_basket[key].append(txn)
+        # Transactions are pre-sorted by (settlement date, basket) at load
+        # time, so grouping needs only a single linear pass.
+        sales_by_date_basket = [
+            (key, list(txns))
+            for key, txns in groupby(
+                (t for t in self.activity
+                 if 'Sold' in t.action and t.symbol not in money_market_symbols),
+                key=lambda t: (t.settlement_date, t.basket or '')
+            )
+        ]
 
         if not sales_by_date_basket:
             return None
@@ -392,7 +423,8 @@ class Statement:
 
             journal_number = 30001
 
-            for (settlement_date, basket), txns in sorted(sales_by_date_basket.items()):
+            for (settlement_date, basket), txns in sales_by_date_basket:
+                jn_str = str(journal_number)
                 basket_suffix = f"-{basket}" if basket else ""
                 basket_name, income_account = basket_income_accounts.get(basket, ('', 'Income - Equity Securities'))
 
@@ -419,7 +451,7 @@ class Statement:
                     'Journal Date': str(settlement_date),
                     'Reference Number': ref_number,
                     'Journal Number Prefix': 'MMW-',
-                    'Journal Number Suffix': str(journal_number),
+                    'Journal Number Suffix': jn_str,
                     'Notes': notes,
                     'Journal Type': 'both',
                     'Currency': 'USD',
@@ -447,7 +479,7 @@ class Statement:
                                 'Journal Date': str(settlement_date),
                                 'Reference Number': ref_number,
                                 'Journal Number Prefix': 'MMW-',
-                                'Journal Number Suffix': str(journal_number),
+                                'Journal Number Suffix': jn_str,
                                 'Notes': notes,
                                 'Journal Type': 'both',
                                 'Currency': 'USD',
@@ -466,7 +498,7 @@ class Statement:
                                 'Journal Date': str(settlement_date),
                                 'Reference Number': ref_number,
                                 'Journal Number Prefix': 'MMW-',
-                                'Journal Number Suffix': str(journal_number),
+                                'Journal Number Suffix': jn_str,
                                 'Notes': notes,
                                 'Journal Type': 'both',
                                 'Currency': 'USD',
@@ -495,7 +527,7 @@ class Statement:
                         'Journal Date': str(settlement_date),
                         'Reference Number': ref_number,
                         'Journal Number Prefix': 'MMW-',
-                        'Journal Number Suffix': str(journal_number),
+                        'Journal Number Suffix': jn_str,
                         'Notes': notes,
                         'Journal Type': 'both',
                         'Currency': 'USD',
@@ -643,6 +675,7 @@ class Statement:
                     continue
 
                 name, fmv_acct, unr_acct = basket_info[basket_id]
+                jn_str = str(journal_number)
                 ref_number = f"UNR-{period_end}-{basket_id}"
                 notes = f"{period_end} Mark-to-Market - {name}"
                 amount = abs(round(change, 2))
@@ -653,7 +686,7 @@ class Statement:
                         'Journal Date': str(period_end),
                         'Reference Number': ref_number,
                         'Journal Number Prefix': 'MMW-',
-                        'Journal Number Suffix': str(journal_number),
+                        'Journal Number Suffix': jn_str,
                         'Notes': notes,
                         'Journal Type': 'both',
                         'Currency': 'USD',
@@ -670,7 +703,7 @@ class Statement:
                         'Journal Date': str(period_end),
                         'Reference Number': ref_number,
                         'Journal Number Prefix': 'MMW-',
-                        'Journal Number Suffix': str(journal_number),
+                        'Journal Number Suffix': jn_str,
                         'Notes': notes,
                         'Journal Type': 'both',
                         'Currency': 'USD',
@@ -689,7 +722,7 @@ class Statement:
                         'Journal Date': str(period_end),
                         'Reference Number': ref_number,
                         'Journal Number Prefix': 'MMW-',
-                        'Journal Number Suffix': str(journal_number),
+                        'Journal Number Suffix': jn_str,
                         'Notes': notes,
                         'Journal Type': 'both',
                         'Currency': 'USD',
@@ -706,7 +739,7 @@ class Statement:
                         'Journal Date': str(period_end),
                         'Reference Number': ref_number,
                         'Journal Number Prefix': 'MMW-',
-                        'Journal Number Suffix': str(journal_number),
+                        'Journal Number Suffix': jn_str,
                         'Notes': notes,
                         'Journal Type': 'both',
                         'Currency': 'USD',
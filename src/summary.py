@@ -65,14 +65,34 @@ class Summary:
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
         with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            # Filter out empty rows (where all values are empty)
-            rows = [row for row in reader if any(row.values())]
+            # Use csv.reader with positional indexing: the file holds a single
+            # data row, so there is no need for per-row dict construction.
+            reader = csv.reader(f)
+            headers = next(reader, None)
+            if headers is None:
+                raise ValueError(f"CSV file has no data rows: {csv_path}")
+            idx = {header: i for i, header in enumerate(headers)}
 
-            if len(rows) == 0:
+            row = next((r for r in reader if any(r)), None)
+            if row is None:
                 raise ValueError(f"CSV file has no data rows: {csv_path}")
 
-            if len(rows) > 1:
+            if any(any(r) for r in reader):
                 raise ValueError(f"CSV file has multiple data rows (expected 1): {csv_path}")
 
-            return cls.from_csv_row(rows[0])
+            return cls(
+                period_start=date.fromisoformat(row[idx['period_start']]),
+                period_end=date.fromisoformat(row[idx['period_end']]),
+                beginning_value_period=float(row[idx['beginning_value_period']]),
+                additions_period=float(row[idx['additions_period']]),
+                subtractions_period=float(row[idx['subtractions_period']]),
+                change_investment_value_period=float(row[idx['change_investment_value_period']]),
+                ending_value_period=float(row[idx['ending_value_period']]),
+                beginning_value_ytd=float(row[idx['beginning_value_ytd']]),
+                additions_ytd=float(row[idx['additions_ytd']]),
+                subtractions_ytd=float(row[idx['subtractions_ytd']]),
+                change_investment_value_ytd=float(row[idx['change_investment_value_ytd']]),
+                ending_value_ytd=float(row[idx['ending_value_ytd']]),
+                income_period=float(row[idx['income_period']]),
+                income_ytd=float(row[idx['income_ytd']])
+            )
@@ -1,22 +1,32 @@
 import csv
+from itertools import chain
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 from srcx.datasets.journal_entry import JournalEntry
 
 
-def write_journal_entries(entries: list[JournalEntry], file_path: Path) -> Optional[Path]:
+def write_journal_entries(entries: Optional[Iterable[JournalEntry]], file_path: Path) -> Optional[Path]:
     """
     Write journal entries to a CSV file.
 
+    Entries are consumed lazily, so callers may pass a generator and avoid
+    materializing the full list in memory.
+
     Args:
-        entries: List of JournalEntry objects to write
+        entries: Iterable of JournalEntry objects to write (or None)
         file_path: Path to the output CSV file
 
     Returns:
-        The file path if entries were written, None if entries list was empty
+        The file path if entries were written, None if there were no entries
     """
-    if not entries:
+    if entries is None:
+        return None
+
+    # Peek one entry so an empty iterable writes nothing (not even a header).
+    iterator = iter(entries)
+    first = next(iterator, None)
+    if first is None:
         return None
 
     file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -29,27 +39,29 @@ def write_journal_entries(entries: list[JournalEntry], file_path: Path) -> Optio
     ]
 
     with open(file_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for entry in entries:
-            row = {
-                'Journal Date': str(entry.journal_date),
-                'Reference Number': entry.reference_number,
-                'Journal Number Prefix': entry.journal_number_prefix,
-                'Journal Number Suffix': entry.journal_number_suffix,
-                'Notes': entry.notes or '',
-                'Journal Type': entry.journal_type,
-                'Currency': entry.currency,
-                'Account': entry.account,
-                'Description': entry.description or '',
-                'Contact Name': entry.contact_name or '',
-                'Debit': f"{round(entry.debit,2):.2f}" if entry.debit else '',  # txn.amount:,
-                'Credit': f"{round(entry.credit,2):.2f}" if entry.credit else '',
-                'Project Name': entry.project_name or '',
-                'Status': entry.status,
-                'Exchange Rate': entry.exchange_rate or ''
-            }
-            writer.writerow(row)
+        # Plain csv.writer with positional rows: DictWriter would rebuild and
+        # re-validate a dict per entry just to flatten it back to this list.
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+
+        writerow = writer.writerow
+        for entry in chain([first], iterator):
+            writerow([
+                str(entry.journal_date),
+                entry.reference_number,
+                entry.journal_number_prefix,
+                entry.journal_number_suffix,
+                entry.notes or '',
+                entry.journal_type,
+                entry.currency,
+                entry.account,
+                entry.description or '',
+                entry.contact_name or '',
+                f"{round(entry.debit,2):.2f}" if entry.debit else '',
+                f"{round(entry.credit,2):.2f}" if entry.credit else '',
+                entry.project_name or '',
+                entry.status,
+                entry.exchange_rate or ''
+            ])
 
     return file_path
@@ -1,14 +1,38 @@
+import atexit
 from pathlib import Path
+from typing import TextIO
+
+# Open log handles keyed by path; reused across write_log calls so repeated
+# logging pays the open/mkdir cost once per file instead of once per write.
+_handles: dict[str, TextIO] = {}
 
 
 def write_log(content: str, log_file: Path) -> None:
     """
     Append content to a log file.
 
+    The file handle is opened once per path and cached, so repeated calls
+    avoid the open/write/close round trip and the parent mkdir stat.
+
     Args:
         content: The text content to write
         log_file: Path to the log file
     """
-    log_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(log_file, 'a', encoding='utf-8') as f:
-        f.write(content + "\n\n")
+    key = str(log_file)
+    handle = _handles.get(key)
+    if handle is None:
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        handle = open(log_file, 'a', encoding='utf-8')
+        _handles[key] = handle
+    handle.write(content + "\n\n")
+    handle.flush()
+
+
+def close_logs() -> None:
+    """Close all cached log file handles."""
+    for handle in _handles.values():
+        handle.close()
+    _handles.clear()
+
+
+atexit.register(close_logs)
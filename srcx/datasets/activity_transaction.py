@@ -3,7 +3,7 @@ from datetime import date
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ActivityTransaction:
     """Represents a single securities activity transaction entry (buy/sell)."""
     settlement_date: date
@@ -16,3 +16,5 @@ class ActivityTransaction:
     transaction_cost: Optional[float]
     basket: Optional[str]
     cost_basis: Optional[float]
+    # set once at parse time so downstream filters avoid repeated set probes
+    is_money_market: bool = False
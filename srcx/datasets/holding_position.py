@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class HoldingPosition:
     """Represents a single holding position from the holdings scrape."""
     symbol: str
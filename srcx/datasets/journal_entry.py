@@ -10,7 +10,7 @@ from datetime import date
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class JournalEntry:
     journal_date: date
     reference_number: str
@@ -29,6 +29,11 @@ class JournalEntry:
     exchange_rate: Optional[str]
     account_code: Optional[str]
 
+    @classmethod
+    def from_row(cls, row: tuple) -> 'JournalEntry':
+        """Build a JournalEntry from a positional tuple (hot bulk-construction path)."""
+        return cls(*row)
+
     @property
     def journal_number(self) -> str:
         return f"{self.journal_number_prefix}{self.journal_number_suffix}"
@@ -1,6 +1,11 @@
 import csv
-from csv import DictReader
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from datetime import date
+from functools import cached_property
+from itertools import chain
 from pathlib import Path
 from typing import Iterator, Optional, Union
 from srcx.common.file_location import FileLocation
@@ -11,7 +16,37 @@ from srcx.common.log_writer import write_log
 from collections import defaultdict
 
 
-MONEY_MARKET_SYMBOLS = {'FDRXX', 'SPAXX', 'FCASH'}
+MONEY_MARKET_SYMBOLS = frozenset({'FDRXX', 'SPAXX', 'FCASH'})
+
+# Shared string constants for JournalEntry construction; interned so every
+# generated entry references a single object instead of a per-entry copy.
+_PREFIX = sys.intern('MMW-')
+_BOTH = sys.intern('both')
+_USD = sys.intern('USD')
+_PUBLISHED = sys.intern('published')
+_EMPTY = sys.intern('')
+_CASH_ACCOUNT = sys.intern('Cash - Fidelity Cash Management Account')
+
+# Template JournalEntry carrying the invariant fields; per-row entries are
+# stamped out with dataclasses.replace so only the varying fields are stored.
+_ENTRY_TEMPLATE = JournalEntry(
+    journal_date=date.min,
+    reference_number=_EMPTY,
+    journal_number_prefix=_PREFIX,
+    journal_number_suffix=_EMPTY,
+    notes=None,
+    journal_type=_BOTH,
+    currency=_USD,
+    account=_EMPTY,
+    description=None,
+    contact_name=_EMPTY,
+    debit=None,
+    credit=None,
+    project_name=_EMPTY,
+    status=_PUBLISHED,
+    exchange_rate=_EMPTY,
+    account_code=None,
+)
 
 BASKET_INCOME_ACCOUNTS = {
     '10001': ('Water Investments', 'Income - Equity Securities Baskets - Water Investments'),
@@ -35,45 +70,128 @@ class Activity(object):
         self._file_location = file_location
         self._entries: list[ActivityTransaction] = []
         self._symbol_map: dict[str, str] = {}
-        self._load(self._file_location.activity_file)
-        self._load_chart_of_accounts()
+        self._hydrated = False
+
+    def _ensure_hydrated(self) -> None:
+        """
+        Hydrate from disk on first data access.
+
+        Construction stays I/O-free so callers that only need metadata
+        (year/month/repr) never pay for parsing skipped months.
+        """
+        if self._hydrated:
+            return
+        # The activity CSV and the chart of accounts are independent reads;
+        # overlap the blocking I/O with a small thread pool.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            load_future = executor.submit(self._load, self._file_location.activity_file)
+            chart_future = executor.submit(self._load_chart_of_accounts)
+            load_future.result()
+            chart_future.result()
+        self._hydrated = True
 
     def _load(self, csv_path: Path) -> None:
         """Load activity data from CSV file."""
         if not csv_path.exists():
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader: DictReader[str] = csv.DictReader(f)
+        # 256 KiB read buffer: fewer syscalls than the default 8 KiB when
+        # pulling multi-MB statement files off disk or network storage.
+        with open(csv_path, 'r', encoding='utf-8', buffering=1 << 18) as f:
+            # csv.reader + positional indexing skips DictReader's per-row
+            # dict allocation; the header map is built once up front.
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return
+            idx = {name: i for i, name in enumerate(header)}
+            i_date = idx['settlement_date']
+            i_action = idx['action']
+            i_symbol = idx['symbol']
+            i_name = idx['security_name']
+            i_quantity = idx['quantity']
+            i_price = idx['price']
+            i_amount = idx['amount']
+            i_cost = idx.get('transaction_cost')
+            i_basket = idx.get('basket')
+            i_basis = idx.get('cost_basis')
+
+            # Hoist lookups out of the per-row loop; row parsing is the
+            # bottleneck so the loop body stays as lean as possible.
+            append = self._entries.append
+            parse_date = date.fromisoformat
+            intern = sys.intern
+            to_float = float
+            # Many rows share a settlement date; memoize so each distinct
+            # date string is parsed (and allocated) only once.
+            date_cache: dict[str, date] = {}
             for row in reader:
-                if not any(row.values()):
+                if not any(row):
                     continue
 
+                date_str = row[i_date]
+                settlement_date = date_cache.get(date_str)
+                if settlement_date is None:
+                    settlement_date = date_cache[date_str] = parse_date(date_str)
+
+                symbol = intern(row[i_symbol])
+
+                # optional columns may be absent from older scrape files
+                transaction_cost = row[i_cost] if i_cost is not None else ''
+                basket = row[i_basket] if i_basket is not None else ''
+                cost_basis = row[i_basis] if i_basis is not None and i_basis < len(row) else ''
+
                 entry = ActivityTransaction(
-                    settlement_date=date.fromisoformat(row['settlement_date']),
-                    action=row['action'],
-                    symbol=row['symbol'],
-                    security_name=row['security_name'],
-                    quantity=float(row['quantity']),
-                    price=float(row['price']),
-                    amount=float(row['amount']),
-                    transaction_cost=float(row['transaction_cost']) if row.get('transaction_cost') else None,
-                    basket=row.get('basket') if row.get('basket') else None,
-                    cost_basis=float(row['cost_basis']) if row.get('cost_basis') else None,
+                    settlement_date=settlement_date,
+                    action=intern(row[i_action]),
+                    symbol=symbol,
+                    security_name=row[i_name],
+                    quantity=to_float(row[i_quantity]),
+                    price=to_float(row[i_price]),
+                    amount=to_float(row[i_amount]),
+                    transaction_cost=to_float(transaction_cost) if transaction_cost else None,
+                    basket=basket or None,
+                    cost_basis=to_float(cost_basis) if cost_basis else None,
+                    is_money_market=symbol in MONEY_MARKET_SYMBOLS,
                 )
-                self._entries.append(entry)
-
-        # group transactions by (date, basket) and action
-        self._bought_by_date_basket: dict[tuple, list] = defaultdict(list)
-        self._sold_by_date_basket: dict[tuple, list] = defaultdict(list)
+                append(entry)
+
+        # Sort once by (date, basket, symbol): group iteration then comes out
+        # pre-ordered and per-group symbol lists are already sorted.
+        self._entries.sort(key=lambda t: (t.settlement_date, t.basket or '', t.symbol))
+
+        # group transactions by (date, basket) and action, aggregating the
+        # buy/sell totals in the same pass so the total_* properties are O(1).
+        # A single dict of (bought, sold) pairs keeps it to one hash probe
+        # per row instead of one per action-specific dict.
+        groups: dict[tuple, tuple[list, list]] = {}
+        self._bought: list[ActivityTransaction] = []
+        self._sold: list[ActivityTransaction] = []
+        self._total_bought = 0.0
+        self._total_sold = 0.0
+        self._total_cost_basis_sold = 0.0
         for txn in self._entries:
-            if txn.symbol in MONEY_MARKET_SYMBOLS:
+            if txn.is_money_market:
                 continue
             key = (txn.settlement_date, txn.basket or '')
+            bought, sold = groups.setdefault(key, ([], []))
             if txn.action == 'You Bought':
-                self._bought_by_date_basket[key].append(txn)
+                bought.append(txn)
+                self._bought.append(txn)
+                self._total_bought += txn.amount
             elif txn.action == 'You Sold':
-                self._sold_by_date_basket[key].append(txn)
+                sold.append(txn)
+                self._sold.append(txn)
+                self._total_sold += txn.amount
+                if txn.cost_basis:
+                    self._total_cost_basis_sold += txn.cost_basis
+
+        self._bought_by_date_basket: dict[tuple, list] = {
+            key: bought for key, (bought, _) in groups.items() if bought
+        }
+        self._sold_by_date_basket: dict[tuple, list] = {
+            key: sold for key, (_, sold) in groups.items() if sold
+        }
 
     def _load_chart_of_accounts(self) -> None:
         """Load chart of accounts to map symbols to full account names."""
@@ -82,10 +200,14 @@ class Activity(object):
         if not chart_path.exists():
             return
 
-        with open(chart_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+        with open(chart_path, 'r', encoding='utf-8', buffering=1 << 18) as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return
+            i_account_name = header.index('Account Name')
             for row in reader:
-                account_name = row['Account Name']
+                account_name = row[i_account_name]
                 if '(' in account_name and ')' in account_name:
                     start = account_name.rfind('(')
                     end = account_name.rfind(')')
@@ -102,100 +224,93 @@ class Activity(object):
 
     @property
     def entries(self) -> list[ActivityTransaction]:
+        self._ensure_hydrated()
         return self._entries
 
     @property
     def bought(self) -> list[ActivityTransaction]:
-        """Return only buy transactions (excluding money market)."""
-        return [e for e in self._entries if e.action == 'You Bought' and e.symbol not in MONEY_MARKET_SYMBOLS]
+        """Return only buy transactions (excluding money market), filtered at load time."""
+        self._ensure_hydrated()
+        return self._bought
 
     @property
     def sold(self) -> list[ActivityTransaction]:
-        """Return only sell transactions (excluding money market)."""
-        return [e for e in self._entries if e.action == 'You Sold' and e.symbol not in MONEY_MARKET_SYMBOLS]
+        """Return only sell transactions (excluding money market), filtered at load time."""
+        self._ensure_hydrated()
+        return self._sold
 
     @property
     def total_bought(self) -> float:
-        """Total of all purchase amounts."""
-        return sum(e.amount for e in self.bought)
+        """Total of all purchase amounts (pre-aggregated at load time)."""
+        self._ensure_hydrated()
+        return self._total_bought
 
     @property
     def total_sold(self) -> float:
-        """Total of all sale amounts."""
-        return sum(e.amount for e in self.sold)
+        """Total of all sale amounts (pre-aggregated at load time)."""
+        self._ensure_hydrated()
+        return self._total_sold
 
     @property
     def total_cost_basis_sold(self) -> float:
-        """Total cost basis of all sold securities."""
-        return sum(e.cost_basis for e in self.sold if e.cost_basis)
+        """Total cost basis of all sold securities (pre-aggregated at load time)."""
+        self._ensure_hydrated()
+        return self._total_cost_basis_sold
 
     @property
     def realized_gain(self) -> float:
         """Realized gain/loss from sales (proceeds - cost basis)."""
         return self.total_sold - self.total_cost_basis_sold
 
-    @property
+    @cached_property
     def purchase_journal_entries(self) -> Union[list[JournalEntry], None]:
-        """Generate journal entries for purchases."""
+        """Generate journal entries for purchases (computed once, then cached)."""
+        self._ensure_hydrated()
         if not self._bought_by_date_basket:
             return None
 
         _return_value: list[JournalEntry] = []
         journal_number = 20001
+        sym_get = self._symbol_map.get
 
-        for (settlement_date, basket), txns in sorted(self._bought_by_date_basket.items()):
+        for (settlement_date, basket), txns in self._bought_by_date_basket.items():
             basket_suffix = f"-{basket}" if basket else ""
             ref_number = f"PUR-{settlement_date}{basket_suffix}"
-            symbols = ', '.join(sorted(set(t.symbol for t in txns)))
+            jn_suffix = str(journal_number)
+            symbols = ', '.join(dict.fromkeys(t.symbol for t in txns))
             notes = f"{settlement_date} Purchase - {symbols}"
             total_amount = round(sum(t.amount for t in txns), 3)
 
-            # Debit: Investment accounts (one per transaction)
-            for txn in txns:
-                account_name = self._symbol_map.get(txn.symbol, txn.symbol)
-                if txn.quantity and txn.price:
-                    description = f"Purchase - {txn.symbol} - {txn.quantity:.3f} @ ~ ${txn.price:.2f}"
-                else:
-                    description = f"Purchase - {txn.symbol}"
-
-                _row = JournalEntry(
+            # Debit: Investment accounts (one per transaction), emitted in a
+            # single batched extend instead of a per-row append call.
+            _return_value.extend(
+                replace(
+                    _ENTRY_TEMPLATE,
                     journal_date=settlement_date,
                     reference_number=ref_number,
-                    journal_number_prefix='MMW-',
-                    journal_number_suffix=str(journal_number),
+                    journal_number_suffix=jn_suffix,
                     notes=notes,
-                    journal_type='both',
-                    currency='USD',
-                    account=account_name,
-                    description=description,
-                    contact_name='',
-                    debit=txn.amount,
-                    credit=None,
-                    project_name='',
-                    status='published',
-                    exchange_rate='',
-                    account_code=None
+                    account=sym_get(txn.symbol, txn.symbol),
+                    description=(
+                        f"Purchase - {txn.symbol} - {txn.quantity:.3f} @ ~ ${txn.price:.2f}"
+                        if txn.quantity and txn.price
+                        else f"Purchase - {txn.symbol}"
+                    ),
+                    debit=txn.amount
                 )
-                _return_value.append(_row)
+                for txn in txns
+            )
 
             # Credit: Cash (total amount)
-            _row = JournalEntry(
+            _row = replace(
+                _ENTRY_TEMPLATE,
                 journal_date=settlement_date,
                 reference_number=ref_number,
-                journal_number_prefix='MMW-',
-                journal_number_suffix=str(journal_number),
+                journal_number_suffix=jn_suffix,
                 notes=notes,
-                journal_type='both',
-                currency='USD',
-                account='Cash - Fidelity Cash Management Account',
+                account=_CASH_ACCOUNT,
                 description=f"Cash for {symbols}",
-                contact_name='',
-                debit=None,
-                credit=total_amount,
-                project_name='',
-                status='published',
-                exchange_rate='',
-                account_code=None
+                credit=total_amount
             )
             _return_value.append(_row)
 
@@ -203,21 +318,25 @@ class Activity(object):
 
         return _return_value
 
-    @property
+    @cached_property
     def sale_journal_entries(self) -> Union[list[JournalEntry], None]:
-        """Generate journal entries for sales."""
+        """Generate journal entries for sales (computed once, then cached)."""
+        self._ensure_hydrated()
         if not self._sold_by_date_basket:
             return None
 
         _return_value: list[JournalEntry] = []
         journal_number = 30001
+        sym_get = self._symbol_map.get
+        bia_get = BASKET_INCOME_ACCOUNTS.get
 
-        for (settlement_date, basket), txns in sorted(self._sold_by_date_basket.items()):
+        for (settlement_date, basket), txns in self._sold_by_date_basket.items():
             basket_suffix = f"-{basket}" if basket else ""
-            basket_name, income_account = BASKET_INCOME_ACCOUNTS.get(basket, ('', 'Income - Equity Securities'))
+            basket_name, income_account = bia_get(basket, ('', 'Income - Equity Securities'))
 
             ref_number = f"SAL-{settlement_date}{basket_suffix}"
-            symbols = ', '.join(sorted(set(t.symbol for t in txns)))
+            jn_suffix = str(journal_number)
+            symbols = ', '.join(dict.fromkeys(t.symbol for t in txns))
 
             if basket_name:
                 notes = f"{settlement_date} Sale - {basket_name} - {symbols}"
@@ -226,127 +345,103 @@ class Activity(object):
 
             total_proceeds = sum(t.amount for t in txns)
 
-            # Group transactions by symbol for consolidated entries
-            symbol_totals: dict[str, dict] = defaultdict(lambda: {'proceeds': 0.0, 'cost_basis': 0.0, 'quantity': 0.0})
+            # Group transactions by symbol for consolidated entries. One dict
+            # probe per txn into a [proceeds, cost_basis, quantity] accumulator
+            # instead of three nested-dict lookups.
+            symbol_totals: dict[str, list[float]] = {}
             for txn in txns:
-                symbol_totals[txn.symbol]['proceeds'] += txn.amount
-                symbol_totals[txn.symbol]['cost_basis'] += txn.cost_basis if txn.cost_basis else txn.amount
-                symbol_totals[txn.symbol]['quantity'] += txn.quantity if txn.quantity else 0
+                totals = symbol_totals.get(txn.symbol)
+                if totals is None:
+                    totals = symbol_totals[txn.symbol] = [0.0, 0.0, 0.0]
+                totals[0] += txn.amount
+                totals[1] += txn.cost_basis if txn.cost_basis else txn.amount
+                totals[2] += txn.quantity if txn.quantity else 0
 
             # 1. Debit cash account for total proceeds
-            _row = JournalEntry(
+            _row = replace(
+                _ENTRY_TEMPLATE,
                 journal_date=settlement_date,
                 reference_number=ref_number,
-                journal_number_prefix='MMW-',
-                journal_number_suffix=str(journal_number),
+                journal_number_suffix=jn_suffix,
                 notes=notes,
-                journal_type='both',
-                currency='USD',
-                account='Cash - Fidelity Cash Management Account',
+                account=_CASH_ACCOUNT,
                 description=f"Proceeds from {basket_name + ' - ' if basket_name else ''}{symbols}",
-                contact_name='',
-                debit=total_proceeds,
-                credit=None,
-                project_name='',
-                status='published',
-                exchange_rate='',
-                account_code=None
+                debit=total_proceeds
             )
             _return_value.append(_row)
 
-            # 2. Record realized gains/losses per symbol
-            for symbol in sorted(symbol_totals.keys()):
-                totals = symbol_totals[symbol]
-                proceeds = totals['proceeds']
-                cost_basis = totals['cost_basis']
-                gain_loss = proceeds - cost_basis
+            # 2. Record realized gains/losses per symbol. Work in rounded
+            # integer cents: materiality becomes a simple nonzero test and
+            # the repeated abs()/round() on the same float goes away.
+            for symbol, (proceeds, cost_basis, _) in symbol_totals.items():
+                gain_loss_cents = round((proceeds - cost_basis) * 100)
 
-                if abs(gain_loss) >= 0.01:  # Only record if material
-                    if gain_loss < 0:
+                if gain_loss_cents:  # Only record if material (>= 1 cent)
+                    if gain_loss_cents < 0:
                         # Realized loss - debit income account
-                        _row = JournalEntry(
+                        _row = replace(
+                            _ENTRY_TEMPLATE,
                             journal_date=settlement_date,
                             reference_number=ref_number,
-                            journal_number_prefix='MMW-',
-                            journal_number_suffix=str(journal_number),
+                            journal_number_suffix=jn_suffix,
                             notes=notes,
-                            journal_type='both',
-                            currency='USD',
                             account=income_account,
                             description=f"Realized Loss - {symbol}",
-                            contact_name='',
-                            debit=abs(gain_loss),
-                            credit=None,
-                            project_name='',
-                            status='published',
-                            exchange_rate='',
-                            account_code=None
+                            debit=-gain_loss_cents / 100.0
                         )
                     else:
                         # Realized gain - credit income account
-                        _row = JournalEntry(
+                        _row = replace(
+                            _ENTRY_TEMPLATE,
                             journal_date=settlement_date,
                             reference_number=ref_number,
-                            journal_number_prefix='MMW-',
-                            journal_number_suffix=str(journal_number),
+                            journal_number_suffix=jn_suffix,
                             notes=notes,
-                            journal_type='both',
-                            currency='USD',
                             account=income_account,
                             description=f"Realized Gain - {symbol}",
-                            contact_name='',
-                            debit=None,
-                            credit=gain_loss,
-                            project_name='',
-                            status='published',
-                            exchange_rate='',
-                            account_code=None
+                            credit=gain_loss_cents / 100.0
                         )
                     _return_value.append(_row)
 
-            # 3. Credit security accounts with cost basis (reducing asset)
-            for symbol in sorted(symbol_totals.keys()):
-                totals = symbol_totals[symbol]
-                cost_basis = totals['cost_basis']
-                quantity = totals['quantity']
-                account_name = self._symbol_map.get(symbol, symbol)
-
-                # Calculate average price for description
-                avg_price = totals['proceeds'] / quantity if quantity else 0
-                description = f"Sale - {symbol} - {quantity:.3f} @ ~ ${avg_price:.2f}"
-
-                _row = JournalEntry(
+            # 3. Credit security accounts with cost basis (reducing asset),
+            # batched as one extend; average price is derived inline.
+            _return_value.extend(
+                replace(
+                    _ENTRY_TEMPLATE,
                     journal_date=settlement_date,
                     reference_number=ref_number,
-                    journal_number_prefix='MMW-',
-                    journal_number_suffix=str(journal_number),
+                    journal_number_suffix=jn_suffix,
                     notes=notes,
-                    journal_type='both',
-                    currency='USD',
-                    account=account_name,
-                    description=description,
-                    contact_name='',
-                    debit=None,
-                    credit=cost_basis,
-                    project_name='',
-                    status='published',
-                    exchange_rate='',
-                    account_code=None
+                    account=sym_get(symbol, symbol),
+                    description=f"Sale - {symbol} - {quantity:.3f} @ ~ ${proceeds / quantity if quantity else 0:.2f}",
+                    credit=cost_basis
                 )
-                _return_value.append(_row)
+                for symbol, (proceeds, cost_basis, quantity) in symbol_totals.items()
+            )
 
             journal_number += 1
 
         return _return_value
 
-    @property
+    def iter_journal_entries(self) -> Iterator[JournalEntry]:
+        """
+        Yield all journal entries (purchases then sales) lazily.
+
+        Single-pass consumers can use this instead of journal_entries to
+        avoid materializing the concatenated list.
+        """
+        return chain(self.purchase_journal_entries or (), self.sale_journal_entries or ())
+
+    @cached_property
     def journal_entries(self) -> Union[list[JournalEntry], None]:
         """All journal entries (purchases + sales)."""
         entries: list[JournalEntry] = []
-        if self.purchase_journal_entries:
-            entries.extend(self.purchase_journal_entries)
-        if self.sale_journal_entries:
-            entries.extend(self.sale_journal_entries)
+        purchases = self.purchase_journal_entries
+        sales = self.sale_journal_entries
+        if purchases:
+            entries.extend(purchases)
+        if sales:
+            entries.extend(sales)
         return entries if entries else None
 
     def write(self) -> dict[str, Optional[Path]]:
@@ -358,10 +453,13 @@ class Activity(object):
 
     def pprint(self, log: bool = False) -> None:
 
-        output_lines: list[str] = []
+        # Stream into a single buffer rather than growing a list of lines and
+        # joining at the end; the per-entry loop is the hot path here.
+        buf = io.StringIO()
+        write = buf.write
 
-        output_lines.append(f"{self.__repr__()}")
-        output_lines.append("-" * 150)
+        write(f"{self.__repr__()}\n")
+        write("-" * 150 + "\n")
 
         _header = (
             f"Total Transactions: {len(self.entries)}\n"
@@ -374,35 +472,49 @@ class Activity(object):
             f"Activity File: {self._file_location.activity_file}"
         )
 
-        output_lines.append(_header)
-        output_lines.append("-" * 150)
+        write(_header + "\n")
+        write("-" * 150 + "\n")
 
         entries = self.journal_entries
 
-        output_lines.append(f"{'Date':<12} {'Journal #':<12} {'Description':<45} {'Account':<50} {'Debit':>12} {'Credit':>12}")
-        output_lines.append("-" * 150)
+        write(f"{'Date':<12} {'Journal #':<12} {'Description':<45} {'Account':<50} {'Debit':>12} {'Credit':>12}\n")
+        write("-" * 150 + "\n")
 
         if not entries:
-            output_lines.append("There are no journal entries.")
+            write("There are no journal entries.")
         else:
+            # Bind the money formatter once; f-string formatting re-parses the
+            # spec per call while a bound format method does not.
+            fmt2 = "{:,.2f}".format
             prev_journal_number = None
+            # Totals are accumulated in the same pass that formats the rows,
+            # so the entry list is only walked once.
+            total_debit = 0.0
+            total_credit = 0.0
             for e in entries:
-                if prev_journal_number is not None and e.journal_number != prev_journal_number:
-                    output_lines.append("")
-                prev_journal_number = e.journal_number
-                debit_str = f"{e.debit:,.2f}" if e.debit else ""
-                credit_str = f"{e.credit:,.2f}" if e.credit else ""
+                journal_number = e.journal_number
+                if prev_journal_number is not None and journal_number != prev_journal_number:
+                    write("\n")
+                prev_journal_number = journal_number
+                if e.debit:
+                    total_debit += e.debit
+                    debit_str = fmt2(e.debit)
+                else:
+                    debit_str = ""
+                if e.credit:
+                    total_credit += e.credit
+                    credit_str = fmt2(e.credit)
+                else:
+                    credit_str = ""
                 desc_display = e.description[:43] + ".." if e.description and len(e.description) > 45 else (e.description or "")
                 account_display = e.account[:48] + ".." if len(e.account) > 50 else e.account
-                output_lines.append(
-                    f"{str(e.journal_date):<12} {e.journal_number:<12} {desc_display:<45} {account_display:<50} {debit_str:>12} {credit_str:>12}"
+                write(
+                    f"{str(e.journal_date):<12} {journal_number:<12} {desc_display:<45} {account_display:<50} {debit_str:>12} {credit_str:>12}\n"
                 )
-            output_lines.append("-" * 150)
-            total_debit = sum(e.debit for e in entries if e.debit)
-            total_credit = sum(e.credit for e in entries if e.credit)
-            output_lines.append(f"{'Total':<122} {total_debit:>12,.2f} {total_credit:>12,.2f}")
+            write("-" * 150 + "\n")
+            write(f"{'Total':<122} {total_debit:>12,.2f} {total_credit:>12,.2f}")
 
-        output = "\n".join(output_lines)
+        output = buf.getvalue()
         print(output)
 
         if log:
@@ -411,16 +523,20 @@ class Activity(object):
         return None
 
     def __len__(self) -> int:
+        self._ensure_hydrated()
         return len(self._entries)
 
     def __iter__(self) -> Iterator[ActivityTransaction]:
+        self._ensure_hydrated()
         return iter(self._entries)
 
     def __str__(self) -> str:
         return f"{self._file_location.activity_file}"
 
     def __float__(self) -> float:
-        return self.total_bought - self.total_sold
+        # totals are pre-aggregated at load, so this is a constant-time read
+        self._ensure_hydrated()
+        return self._total_bought - self._total_sold
 
     def __repr__(self) -> str:
         """String representation of Activity."""
@@ -1,7 +1,13 @@
 import csv
-from csv import DictReader
+import math
+import io
+import sys
+from dataclasses import replace
 from datetime import date
+from functools import cached_property
+from operator import attrgetter
 from pathlib import Path
+from types import MappingProxyType
 from typing import Iterator, Optional, Union
 from srcx.common.file_location import FileLocation
 from srcx.datasets.holding_position import HoldingPosition
@@ -11,10 +17,19 @@ from srcx.common.log_writer import write_log
 from collections import defaultdict
 
 
-MONEY_MARKET_SYMBOLS = {'FDRXX', 'SPAXX', 'FCASH'}
+MONEY_MARKET_SYMBOLS = frozenset({'FDRXX', 'SPAXX', 'FCASH'})
 
-# Symbol to basket mapping
-SYMBOL_TO_BASKET = {
+# Last day of each month; February is adjusted for leap years inline.
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# C-implemented sort key; avoids a Python lambda call per comparison.
+_SYMBOL_KEY = attrgetter('symbol')
+
+# Table separator built once rather than per pprint call.
+_SEP = "-" * 150
+
+# Symbol to basket mapping (read-only view; the tables are reference data)
+SYMBOL_TO_BASKET = MappingProxyType({
     # 10001 - Water Stocks Basket (12 symbols)
     'ALCO': '10001', 'AWK': '10001', 'CWCO': '10001', 'CWT': '10001',
     'ECL': '10001', 'FERG': '10001', 'FPI': '10001', 'GWRS': '10001',
@@ -28,10 +43,10 @@ SYMBOL_TO_BASKET = {
     # 10007 - Balanced ETFs (6 symbols)
     'FDEM': '10007', 'FDEV': '10007', 'FELC': '10007',
     'FESM': '10007', 'FMDE': '10007', 'ONEQ': '10007',
-}
+})
 
 # Basket configuration: (name, fmv_adjustment_account, unrealized_gain_account)
-BASKET_ACCOUNTS = {
+BASKET_ACCOUNTS = MappingProxyType({
     '10001': (
         'Water Investments',
         'Trading Securities - Water Basket - FMV Adjustment',
@@ -52,7 +67,121 @@ BASKET_ACCOUNTS = {
         'Trading Securities - Balanced ETFs - FMV Adjustment',
         'Unrealized Gain - Equity Baskets - Balanced ETFs'
     ),
+})
+
+# Fallback configuration for symbols outside the known baskets; hoisted so
+# journal_entries does not allocate a fresh tuple per call.
+_UNKNOWN_BASKET = ('Unknown', 'Trading Securities - FMV Adjustment', 'Unrealized Gain - Equity Baskets')
+
+# Per-basket strings derived once at import: the account names plus every
+# description variant journal_entries can emit for that basket.
+# Basket ids are a fixed, small universe; iterate this instead of sorting
+# the aggregation dict keys on every pass.
+_BASKET_IDS = tuple(sorted(BASKET_ACCOUNTS))
+
+BASKET_TEMPLATES = {
+    basket_id: (
+        name,
+        fmv_account,
+        unrealized_account,
+        f"FMV Adjustment - {name}",
+        f"Unrealized Gain - {name}",
+        f"Unrealized Loss - {name}",
+        f"Liquidation Gain - {name}",
+        f"Liquidation Loss - {name}",
+    )
+    for basket_id, (name, fmv_account, unrealized_account) in BASKET_ACCOUNTS.items()
 }
+_UNKNOWN_TEMPLATE = (
+    _UNKNOWN_BASKET[0], _UNKNOWN_BASKET[1], _UNKNOWN_BASKET[2],
+    'FMV Adjustment - Unknown',
+    'Unrealized Gain - Unknown',
+    'Unrealized Loss - Unknown',
+    'Liquidation Gain - Unknown',
+    'Liquidation Loss - Unknown',
+)
+
+# Base JournalEntry holding the constant fields; journal_entries stamps out
+# rows with dataclasses.replace so only the varying fields are passed.
+_ENTRY_TEMPLATE = JournalEntry(
+    journal_date=date.min,
+    reference_number='',
+    journal_number_prefix=sys.intern('MMW-'),
+    journal_number_suffix='',
+    notes=None,
+    journal_type=sys.intern('both'),
+    currency=sys.intern('USD'),
+    account='',
+    description=None,
+    contact_name='',
+    debit=None,
+    credit=None,
+    project_name='',
+    status=sys.intern('published'),
+    exchange_rate='',
+    account_code=None,
+)
+
+# In-process cache of parsed HLD files keyed by modification time. Each
+# month's holdings file is re-read as the following month's prior-holdings
+# source, so batch runs would otherwise parse every file twice. Callers
+# must treat the returned list as read-only.
+_parsed_holdings_cache: dict[str, tuple[int, list[HoldingPosition]]] = {}
+
+
+def _read_holdings_file(csv_path: Path) -> list[HoldingPosition]:
+    """Parse an HLD CSV into HoldingPosition rows, memoized on file mtime."""
+    cache_key = str(csv_path)
+    mtime_ns = csv_path.stat().st_mtime_ns
+    cached = _parsed_holdings_cache.get(cache_key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    entries: list[HoldingPosition] = []
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        # csv.reader + positional indexing skips DictReader's per-row
+        # dict allocation; the header map is built once up front.
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is not None:
+            idx = {name: i for i, name in enumerate(header)}
+            i_symbol = idx['symbol']
+            i_desc = idx['description']
+            i_quantity = idx['quantity']
+            i_price = idx['price']
+            i_ending = idx['ending_value']
+            i_beginning = idx.get('beginning_value')
+            i_basis = idx.get('cost_basis')
+            i_unrealized = idx.get('unrealized_gain')
+
+            append = entries.append
+            intern = sys.intern
+            for row in reader:
+                # A row without a symbol is a blank/padding line; probing one
+                # cell beats scanning every column with any().
+                if not row or not row[i_symbol]:
+                    continue
+
+                # optional columns may be absent from older scrape files
+                beginning = row[i_beginning] if i_beginning is not None else ''
+                basis = row[i_basis] if i_basis is not None else ''
+                unrealized = row[i_unrealized] if i_unrealized is not None else ''
+
+                append(HoldingPosition(
+                    # interned: repeated lookups against SYMBOL_TO_BASKET and
+                    # MONEY_MARKET_SYMBOLS then short-circuit on identity.
+                    symbol=intern(row[i_symbol]),
+                    description=row[i_desc],
+                    quantity=float(row[i_quantity]),
+                    price=float(row[i_price]),
+                    beginning_value=float(beginning) if beginning else None,
+                    ending_value=float(row[i_ending]),
+                    cost_basis=float(basis) if basis else None,
+                    unrealized_gain=float(unrealized) if unrealized else None,
+                ))
+
+    _parsed_holdings_cache[cache_key] = (mtime_ns, entries)
+    return entries
 
 
 class Holdings(object):
@@ -71,35 +200,32 @@ class Holdings(object):
         """
         self._file_location = file_location
         self._entries: list[HoldingPosition] = []
-        self._purchases_by_symbol: dict[str, float] = defaultdict(float)
-        self._sales_by_symbol: dict[str, dict] = defaultdict(lambda: {'proceeds': 0.0, 'cost_basis': 0.0})
+        self._purchases_by_symbol: dict[str, float] = {}
+        self._sales_proceeds: dict[str, float] = defaultdict(float)
+        self._sales_cost_basis: dict[str, float] = defaultdict(float)
         self._prior_values: dict[str, float] = {}
+        # Journal date (last day of the period) is fixed per instance.
+        _year, _month = file_location.year, file_location.month
+        _last_day = _DAYS_IN_MONTH[_month - 1]
+        if _month == 2 and _year % 4 == 0 and (_year % 100 != 0 or _year % 400 == 0):
+            _last_day = 29
+        self._journal_date = date(_year, _month, _last_day)
+        self._journal_date_str = str(self._journal_date)
         self._load_holdings(self._file_location.holdings_file)
         self._load_activity(self._file_location.activity_file)
         self._load_prior_holdings()
+        # Positions are immutable post-load; filter money market funds once
+        # instead of re-running the list comprehension on every access.
+        self._holdings = [e for e in self._entries if e.symbol not in MONEY_MARKET_SYMBOLS]
+        self._sorted_holdings = sorted(self._holdings, key=_SYMBOL_KEY)
+        self._holdings_symbols = frozenset(e.symbol for e in self._entries)
 
     def _load_holdings(self, csv_path: Path) -> None:
         """Load holdings data from CSV file."""
         if not csv_path.exists():
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader: DictReader[str] = csv.DictReader(f)
-            for row in reader:
-                if not any(row.values()):
-                    continue
-
-                entry = HoldingPosition(
-                    symbol=row['symbol'],
-                    description=row['description'],
-                    quantity=float(row['quantity']),
-                    price=float(row['price']),
-                    beginning_value=float(row['beginning_value']) if row.get('beginning_value') else None,
-                    ending_value=float(row['ending_value']),
-                    cost_basis=float(row['cost_basis']) if row.get('cost_basis') else None,
-                    unrealized_gain=float(row['unrealized_gain']) if row.get('unrealized_gain') else None,
-                )
-                self._entries.append(entry)
+        self._entries = list(_read_holdings_file(csv_path))
 
     def _load_activity(self, csv_path: Path) -> None:
         """Load activity data to get purchases and sales during the period."""
@@ -107,21 +233,81 @@ class Holdings(object):
             # No activity file means no activity to account for
             return
 
+        with open(csv_path, 'rb') as f:
+            data = f.read()
+
+        if b'"' in data:
+            # Quoted fields need the real CSV state machine.
+            self._load_activity_csv(csv_path)
+            return
+
+        # Scrape files are plain unquoted ASCII, so byte-level splitlines and
+        # split outrun the csv module: non-matching rows are rejected on a
+        # bytes compare before any field decoding or float parsing happens.
+        lines = data.splitlines()
+        if not lines:
+            return
+        header = lines[0].decode('utf-8').split(',')
+        idx = {name: i for i, name in enumerate(header)}
+        i_action = idx['action']
+        i_symbol = idx['symbol']
+        i_amount = idx['amount']
+        i_basis = idx.get('cost_basis')
+        max_col = max(i_action, i_symbol, i_amount, i_basis or 0)
+
+        bought = b'You Bought'
+        sold = b'You Sold'
+        purchases = self._purchases_by_symbol
+        purchases_get = purchases.get
+        intern = sys.intern
+        for line in lines[1:]:
+            if not line:
+                continue
+            parts = line.split(b',', max_col + 1)
+            action = parts[i_action]
+            if action == bought:
+                symbol = intern(parts[i_symbol].decode('utf-8'))
+                purchases[symbol] = purchases_get(symbol, 0.0) + float(parts[i_amount])
+            elif action == sold:
+                basis = parts[i_basis] if i_basis is not None and i_basis < len(parts) else b''
+                symbol = intern(parts[i_symbol].decode('utf-8'))
+                self._sales_proceeds[symbol] += float(parts[i_amount])
+                self._sales_cost_basis[symbol] += float(basis) if basis else 0.0
+
+    def _load_activity_csv(self, csv_path: Path) -> None:
+        """csv.reader fallback for activity files containing quoted fields."""
         with open(csv_path, 'r', encoding='utf-8') as f:
-            reader: DictReader[str] = csv.DictReader(f)
+            # Only three columns matter here; csv.reader with resolved
+            # indices avoids building a dict of unused fields per row and
+            # float parsing only runs for buy/sell rows.
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return
+            idx = {name: i for i, name in enumerate(header)}
+            i_action = idx['action']
+            i_symbol = idx['symbol']
+            i_amount = idx['amount']
+            i_basis = idx.get('cost_basis')
+
+            # A plain dict with one .get probe is cheaper than defaultdict's
+            # __missing__ machinery for the handful of repeated symbols.
+            purchases = self._purchases_by_symbol
+            purchases_get = purchases.get
             for row in reader:
-                if not any(row.values()):
+                # blank/padding rows carry no action; one cell probe suffices
+                if not row or not row[i_action]:
                     continue
 
-                symbol = row['symbol']
-                amount = float(row['amount'])
-
-                if row['action'] == 'You Bought':
-                    self._purchases_by_symbol[symbol] += amount
-                elif row['action'] == 'You Sold':
-                    cost_basis = float(row['cost_basis']) if row.get('cost_basis') else 0.0
-                    self._sales_by_symbol[symbol]['proceeds'] += amount
-                    self._sales_by_symbol[symbol]['cost_basis'] += cost_basis
+                action = row[i_action]
+                if action == 'You Bought':
+                    symbol = sys.intern(row[i_symbol])
+                    purchases[symbol] = purchases_get(symbol, 0.0) + float(row[i_amount])
+                elif action == 'You Sold':
+                    basis = row[i_basis] if i_basis is not None and i_basis < len(row) else ''
+                    symbol = sys.intern(row[i_symbol])
+                    self._sales_proceeds[symbol] += float(row[i_amount])
+                    self._sales_cost_basis[symbol] += float(basis) if basis else 0.0
 
     def _load_prior_holdings(self) -> None:
         """Load prior month's holdings to get ending values for liquidated securities."""
@@ -132,15 +318,11 @@ class Holdings(object):
         if not prior_holdings_path.exists():
             return
 
-        with open(prior_holdings_path, 'r', encoding='utf-8') as f:
-            reader: DictReader[str] = csv.DictReader(f)
-            for row in reader:
-                if not any(row.values()):
-                    continue
-                symbol = row['symbol']
-                ending_value = float(row['ending_value']) if row.get('ending_value') else None
-                if ending_value is not None:
-                    self._prior_values[symbol] = ending_value
+        # The prior month's HLD file is the same file that month's own
+        # Holdings instance hydrates from, so batch runs hit the parse cache
+        # here instead of reading every file twice.
+        for entry in _read_holdings_file(prior_holdings_path):
+            self._prior_values[entry.symbol] = entry.ending_value
 
     @property
     def year(self) -> int:
@@ -156,24 +338,20 @@ class Holdings(object):
 
     @property
     def holdings(self) -> list[HoldingPosition]:
-        """Return holdings excluding money market funds."""
-        return [e for e in self._entries if e.symbol not in MONEY_MARKET_SYMBOLS]
+        """Return holdings excluding money market funds (filtered at load time)."""
+        return self._holdings
 
     @property
     def total_ending_value(self) -> float:
-        """Total ending value of all holdings."""
-        return sum(e.ending_value for e in self.holdings)
+        """Total ending value of all holdings (computed in the aggregate pass)."""
+        self._unrealized_by_basket
+        return self._total_ending_value
 
     @property
     def total_beginning_value(self) -> float:
         """Total beginning value (or cost basis if unavailable) of all holdings."""
-        total = 0.0
-        for e in self.holdings:
-            if e.beginning_value is not None:
-                total += e.beginning_value
-            elif e.cost_basis is not None:
-                total += e.cost_basis
-        return total
+        self._unrealized_by_basket
+        return self._total_beginning_value
 
     def _calculate_change(self, holding: HoldingPosition) -> float:
         """
@@ -205,336 +383,299 @@ class Holdings(object):
 
         return raw_change
 
-    def _get_liquidations(self) -> dict[str, float]:
+    @cached_property
+    def _liquidations(self) -> dict[str, float]:
         """
-        Get change in value for securities that were completely liquidated.
+        Change in value for securities that were completely liquidated.
 
         A liquidation is a sale where the security no longer appears in month-end holdings.
         Change = proceeds - cost_basis
         """
-        holdings_symbols = {e.symbol for e in self._entries}
-        liquidations: dict[str, float] = {}
-
-        for symbol, sale_data in self._sales_by_symbol.items():
-            if symbol not in holdings_symbols and symbol not in MONEY_MARKET_SYMBOLS:
-                # Security was completely liquidated
-                change = sale_data['proceeds'] - sale_data['cost_basis']
-                liquidations[symbol] = change
-
-        return liquidations
+        # One set difference replaces two membership probes per sale; the
+        # dict is still built in sale order to keep summation deterministic.
+        liquidated = self._sales_proceeds.keys() - self._holdings_symbols - MONEY_MARKET_SYMBOLS
+        cost_basis = self._sales_cost_basis
+        return {
+            symbol: proceeds - cost_basis[symbol]
+            for symbol, proceeds in self._sales_proceeds.items()
+            if symbol in liquidated
+        }
 
-    def _get_liquidation_period_change(self) -> dict[str, float]:
+    @cached_property
+    def _liquidation_period_change(self) -> dict[str, float]:
         """
-        Get period change for securities that were completely liquidated.
+        Period change for securities that were completely liquidated.
 
         This measures the change from prior period ending value to sale proceeds,
         which represents the gain/loss during the current period only.
         Change = proceeds - prior_ending_value
         """
-        holdings_symbols = {e.symbol for e in self._entries}
-        period_changes: dict[str, float] = {}
-
-        for symbol, sale_data in self._sales_by_symbol.items():
-            if symbol not in holdings_symbols and symbol not in MONEY_MARKET_SYMBOLS:
-                if symbol in self._prior_values:
-                    prior_value = self._prior_values[symbol]
-                    period_change = sale_data['proceeds'] - prior_value
-                    period_changes[symbol] = period_change
-
-        return period_changes
+        liquidated = (
+            self._sales_proceeds.keys() - self._holdings_symbols - MONEY_MARKET_SYMBOLS
+        ) & self._prior_values.keys()
+        prior_values = self._prior_values
+        return {
+            symbol: proceeds - prior_values[symbol]
+            for symbol, proceeds in self._sales_proceeds.items()
+            if symbol in liquidated
+        }
 
-    def _get_liquidation_period_change_by_basket(self) -> dict[str, float]:
-        """Group liquidation period changes by basket."""
+    @cached_property
+    def _liquidation_period_change_by_basket(self) -> dict[str, float]:
+        """Liquidation period changes grouped by basket."""
         by_basket: dict[str, float] = defaultdict(float)
 
-        period_changes = self._get_liquidation_period_change()
-        for symbol, change in period_changes.items():
+        for symbol, change in self._liquidation_period_change.items():
             basket = SYMBOL_TO_BASKET.get(symbol)
             if basket:
                 by_basket[basket] += change
 
         return dict(by_basket)
 
-    def _get_unrealized_by_basket(self) -> dict[str, float]:
-        """Group unrealized changes by basket (holdings + liquidation period changes)."""
-        by_basket: dict[str, float] = defaultdict(float)
+    @cached_property
+    def _unrealized_by_basket(self) -> dict[str, float]:
+        """
+        Group unrealized changes by basket (holdings + liquidation period changes).
 
-        # Add changes from current holdings
+        Computed once per instance; the same pass also caches each holding's
+        change in _change_by_symbol and folds the ending/beginning value
+        totals, so every aggregate consumer shares one traversal.
+        """
+        by_basket: dict[str, float] = defaultdict(float)
+        basket_get = SYMBOL_TO_BASKET.get
+        purchases_get = self._purchases_by_symbol.get
+
+        # Add changes from current holdings, folding the value totals into
+        # the same loop instead of separate generator sums per property.
+        # _calculate_change is inlined here: attribute reads into locals and
+        # bound dict.get calls beat a method call per holding.
+        end_total = 0.0
+        beg_total = 0.0
+        self._change_by_symbol = {}
+        change_cache = self._change_by_symbol
         for holding in self.holdings:
-            basket = SYMBOL_TO_BASKET.get(holding.symbol)
+            symbol = holding.symbol
+            ending_value = holding.ending_value
+            beginning_value = holding.beginning_value
+            end_total += ending_value
+            if beginning_value is not None:
+                beg_total += beginning_value
+                change = ending_value - beginning_value - purchases_get(symbol, 0.0)
+            elif holding.cost_basis is not None:
+                beg_total += holding.cost_basis
+                change = ending_value - holding.cost_basis
+            else:
+                change = 0.0
+            change_cache[symbol] = change
+            basket = basket_get(symbol)
             if basket:
-                change = self._calculate_change(holding)
                 by_basket[basket] += change
+        self._total_ending_value = end_total
+        self._total_beginning_value = beg_total
 
         # Add period changes for liquidated securities (proceeds - prior_ending_value)
-        liquidation_period_changes = self._get_liquidation_period_change_by_basket()
-        for basket, change in liquidation_period_changes.items():
+        for basket, change in self._liquidation_period_change_by_basket.items():
             by_basket[basket] += change
 
         return dict(by_basket)
 
-    def _get_liquidations_by_basket(self) -> dict[str, float]:
-        """Group liquidation changes by basket."""
+    @cached_property
+    def _liquidations_by_basket(self) -> dict[str, float]:
+        """Liquidation changes grouped by basket."""
         by_basket: dict[str, float] = defaultdict(float)
 
-        liquidations = self._get_liquidations()
-        for symbol, change in liquidations.items():
+        for symbol, change in self._liquidations.items():
             basket = SYMBOL_TO_BASKET.get(symbol)
             if basket:
                 by_basket[basket] += change
 
         return dict(by_basket)
 
-    def _get_total_by_basket(self) -> dict[str, float]:
-        """Get combined unrealized + liquidation changes by basket."""
-        by_basket: dict[str, float] = defaultdict(float)
-
-        unrealized = self._get_unrealized_by_basket()
-        for basket, change in unrealized.items():
-            by_basket[basket] += change
-
-        liquidations = self._get_liquidations_by_basket()
-        for basket, change in liquidations.items():
-            by_basket[basket] += change
-
-        return dict(by_basket)
+    @cached_property
+    def _total_by_basket(self) -> dict[str, float]:
+        """Combined unrealized + liquidation changes by basket."""
+        totals = dict(self._unrealized_by_basket)
+        for basket, change in self._liquidations_by_basket.items():
+            totals[basket] = totals.get(basket, 0.0) + change
+        return totals
 
     @property
     def total_unrealized(self) -> float:
         """Total unrealized gain/loss for all baskets (including liquidations)."""
-        by_basket = self._get_total_by_basket()
-        return sum(by_basket.values())
-
-    @property
-    def journal_entries(self) -> Union[list[JournalEntry], None]:
-        """Generate mark-to-market and liquidation journal entries grouped by basket."""
-        unrealized_by_basket = self._get_unrealized_by_basket()
-        liquidations_by_basket = self._get_liquidations_by_basket()
+        return math.fsum(self._total_by_basket.values())
 
-        if not unrealized_by_basket and not liquidations_by_basket:
-            return None
+    def _iter_journal_entries(self) -> Iterator[JournalEntry]:
+        """Yield mark-to-market and liquidation journal entries lazily."""
+        unrealized_by_basket = self._unrealized_by_basket
+        liquidations_by_basket = self._liquidations_by_basket
 
-        _return_value: list[JournalEntry] = []
         journal_number = 40001
 
-        # Determine the journal date (last day of the period)
-        import calendar
-        last_day = calendar.monthrange(self.year, self.month)[1]
-        journal_date = date(self.year, self.month, last_day)
+        journal_date = self._journal_date
+        journal_date_str = self._journal_date_str
 
         # Generate Mark-to-Market entries (holdings only)
-        for basket_id in sorted(unrealized_by_basket.keys()):
-            change = unrealized_by_basket[basket_id]
-
-            if abs(change) < 0.01:
+        for basket_id in _BASKET_IDS:
+            change = unrealized_by_basket.get(basket_id)
+            if change is None:
+                continue
+            # abs and round once per basket; the branch below carries the sign
+            abs_change = -change if change < 0.0 else change
+            if abs_change < 0.01:
                 # Skip immaterial changes
                 continue
+            rounded = round(abs_change, 2)
 
-            basket_name, fmv_account, unrealized_account = BASKET_ACCOUNTS.get(
-                basket_id,
-                ('Unknown', 'Trading Securities - FMV Adjustment', 'Unrealized Gain - Equity Baskets')
-            )
+            jnum_str = str(journal_number)
+            basket_name, fmv_account, unrealized_account, fmv_desc, gain_desc, loss_desc, _, _ = \
+                BASKET_TEMPLATES.get(basket_id, _UNKNOWN_TEMPLATE)
 
-            ref_number = f"UNR-{journal_date}-{basket_id}"
-            notes = f"{journal_date} Mark-to-Market - {basket_name}"
+            ref_number = f"UNR-{journal_date_str}-{basket_id}"
+            notes = f"{journal_date_str} Mark-to-Market - {basket_name}"
 
             if change >= 0:
                 # Unrealized gain
-                _row_debit = JournalEntry(
+                _row_debit = replace(
+                    _ENTRY_TEMPLATE,
                     journal_date=journal_date,
                     reference_number=ref_number,
-                    journal_number_prefix='MMW-',
-                    journal_number_suffix=str(journal_number),
+                    journal_number_suffix=jnum_str,
                     notes=notes,
-                    journal_type='both',
-                    currency='USD',
                     account=fmv_account,
-                    description=f"FMV Adjustment - {basket_name}",
-                    contact_name='',
-                    debit=round(change, 2),
-                    credit=None,
-                    project_name='',
-                    status='published',
-                    exchange_rate='',
-                    account_code=None
+                    description=fmv_desc,
+                    debit=rounded,
                 )
-                _row_credit = JournalEntry(
+                _row_credit = replace(
+                    _ENTRY_TEMPLATE,
                     journal_date=journal_date,
                     reference_number=ref_number,
-                    journal_number_prefix='MMW-',
-                    journal_number_suffix=str(journal_number),
+                    journal_number_suffix=jnum_str,
                     notes=notes,
-                    journal_type='both',
-                    currency='USD',
                     account=unrealized_account,
-                    description=f"Unrealized Gain - {basket_name}",
-                    contact_name='',
-                    debit=None,
-                    credit=round(change, 2),
-                    project_name='',
-                    status='published',
-                    exchange_rate='',
-                    account_code=None
+                    description=gain_desc,
+                    credit=rounded,
                 )
             else:
                 # Unrealized loss
-                abs_change = abs(change)
-                _row_debit = JournalEntry(
+                _row_debit = replace(
+                    _ENTRY_TEMPLATE,
                     journal_date=journal_date,
                     reference_number=ref_number,
-                    journal_number_prefix='MMW-',
-                    journal_number_suffix=str(journal_number),
+                    journal_number_suffix=jnum_str,
                     notes=notes,
-                    journal_type='both',
-                    currency='USD',
                     account=unrealized_account,
-                    description=f"Unrealized Loss - {basket_name}",
-                    contact_name='',
-                    debit=round(abs_change, 2),
-                    credit=None,
-                    project_name='',
-                    status='published',
-                    exchange_rate='',
-                    account_code=None
+                    description=loss_desc,
+                    debit=rounded,
                 )
-                _row_credit = JournalEntry(
+                _row_credit = replace(
+                    _ENTRY_TEMPLATE,
                     journal_date=journal_date,
                     reference_number=ref_number,
-                    journal_number_prefix='MMW-',
-                    journal_number_suffix=str(journal_number),
+                    journal_number_suffix=jnum_str,
                     notes=notes,
-                    journal_type='both',
-                    currency='USD',
                     account=fmv_account,
-                    description=f"FMV Adjustment - {basket_name}",
-                    contact_name='',
-                    debit=None,
-                    credit=round(abs_change, 2),
-                    project_name='',
-                    status='published',
-                    exchange_rate='',
-                    account_code=None
+                    description=fmv_desc,
+                    credit=rounded,
                 )
 
-            _return_value.append(_row_debit)
-            _return_value.append(_row_credit)
+            yield _row_debit
+            yield _row_credit
             journal_number += 1
 
         # Generate Liquidation entries (separate from mark-to-market)
-        for basket_id in sorted(liquidations_by_basket.keys()):
-            change = liquidations_by_basket[basket_id]
-
-            if abs(change) < 0.01:
+        for basket_id in _BASKET_IDS:
+            change = liquidations_by_basket.get(basket_id)
+            if change is None:
+                continue
+            # abs and round once per basket; the branch below carries the sign
+            abs_change = -change if change < 0.0 else change
+            if abs_change < 0.01:
                 # Skip immaterial changes
                 continue
+            rounded = round(abs_change, 2)
 
-            basket_name, fmv_account, unrealized_account = BASKET_ACCOUNTS.get(
-                basket_id,
-                ('Unknown', 'Trading Securities - FMV Adjustment', 'Unrealized Gain - Equity Baskets')
-            )
+            jnum_str = str(journal_number)
+            basket_name, fmv_account, unrealized_account, fmv_desc, _, _, liq_gain_desc, liq_loss_desc = \
+                BASKET_TEMPLATES.get(basket_id, _UNKNOWN_TEMPLATE)
 
-            ref_number = f"LIQ-{journal_date}-{basket_id}"
-            notes = f"{journal_date} Liquidation - {basket_name}"
+            ref_number = f"LIQ-{journal_date_str}-{basket_id}"
+            notes = f"{journal_date_str} Liquidation - {basket_name}"
 
             if change >= 0:
                 # Liquidation gain
-                _row_debit = JournalEntry(
+                _row_debit = replace(
+                    _ENTRY_TEMPLATE,
                     journal_date=journal_date,
                     reference_number=ref_number,
-                    journal_number_prefix='MMW-',
-                    journal_number_suffix=str(journal_number),
+                    journal_number_suffix=jnum_str,
                     notes=notes,
-                    journal_type='both',
-                    currency='USD',
                     account=fmv_account,
-                    description=f"FMV Adjustment - {basket_name}",
-                    contact_name='',
-                    debit=round(change, 2),
-                    credit=None,
-                    project_name='',
-                    status='published',
-                    exchange_rate='',
-                    account_code=None
+                    description=fmv_desc,
+                    debit=rounded,
                 )
-                _row_credit = JournalEntry(
+                _row_credit = replace(
+                    _ENTRY_TEMPLATE,
                     journal_date=journal_date,
                     reference_number=ref_number,
-                    journal_number_prefix='MMW-',
-                    journal_number_suffix=str(journal_number),
+                    journal_number_suffix=jnum_str,
                     notes=notes,
-                    journal_type='both',
-                    currency='USD',
                     account=unrealized_account,
-                    description=f"Liquidation Gain - {basket_name}",
-                    contact_name='',
-                    debit=None,
-                    credit=round(change, 2),
-                    project_name='',
-                    status='published',
-                    exchange_rate='',
-                    account_code=None
+                    description=liq_gain_desc,
+                    credit=rounded,
                 )
             else:
                 # Liquidation loss - debit FMV asset account, credit unrealized
-                abs_change = abs(change)
-                _row_debit = JournalEntry(
+                _row_debit = replace(
+                    _ENTRY_TEMPLATE,
                     journal_date=journal_date,
                     reference_number=ref_number,
-                    journal_number_prefix='MMW-',
-                    journal_number_suffix=str(journal_number),
+                    journal_number_suffix=jnum_str,
                     notes=notes,
-                    journal_type='both',
-                    currency='USD',
                     account=fmv_account,
-                    description=f"FMV Adjustment - {basket_name}",
-                    contact_name='',
-                    debit=round(abs_change, 2),
-                    credit=None,
-                    project_name='',
-                    status='published',
-                    exchange_rate='',
-                    account_code=None
+                    description=fmv_desc,
+                    debit=rounded,
                 )
-                _row_credit = JournalEntry(
+                _row_credit = replace(
+                    _ENTRY_TEMPLATE,
                     journal_date=journal_date,
                     reference_number=ref_number,
-                    journal_number_prefix='MMW-',
-                    journal_number_suffix=str(journal_number),
+                    journal_number_suffix=jnum_str,
                     notes=notes,
-                    journal_type='both',
-                    currency='USD',
                     account=unrealized_account,
-                    description=f"Liquidation Loss - {basket_name}",
-                    contact_name='',
-                    debit=None,
-                    credit=round(abs_change, 2),
-                    project_name='',
-                    status='published',
-                    exchange_rate='',
-                    account_code=None
+                    description=liq_loss_desc,
+                    credit=rounded,
                 )
 
-            _return_value.append(_row_debit)
-            _return_value.append(_row_credit)
+            yield _row_debit
+            yield _row_credit
             journal_number += 1
 
-        return _return_value if _return_value else None
+    @cached_property
+    def journal_entries(self) -> Union[list[JournalEntry], None]:
+        """Mark-to-market and liquidation journal entries (computed once)."""
+        entries = list(self._iter_journal_entries())
+        return entries if entries else None
 
     def write(self) -> dict[str, Optional[Path]]:
         """Write unrealized journal entries to CSV file."""
+        # the writer consumes the generator directly; no intermediate list
         return {
-            'unrealized': write_journal_entries(self.journal_entries, self._file_location.unrealized_file)
+            'unrealized': write_journal_entries(self._iter_journal_entries(), self._file_location.unrealized_file)
         }
 
     def pprint(self, log: bool = False) -> None:
-        output_lines: list[str] = []
 
-        output_lines.append(f"{self.__repr__()}")
-        output_lines.append("-" * 150)
+        # Stream into a single buffer rather than growing a list of lines
+        # and joining at the end.
+        buf = io.StringIO()
+        write = buf.write
+
+        write(f"{self.__repr__()}\n")
+        write(_SEP + "\n")
 
-        unrealized_by_basket = self._get_unrealized_by_basket()
-        liquidations_by_basket = self._get_liquidations_by_basket()
-        total_by_basket = self._get_total_by_basket()
+        unrealized_by_basket = self._unrealized_by_basket
+        liquidations_by_basket = self._liquidations_by_basket
+        total_by_basket = self._total_by_basket
 
         _header = (
             f"Total Holdings: {len(self.entries)}\n"
@@ -545,17 +686,18 @@ class Holdings(object):
             f"Holdings File: {self._file_location.holdings_file}"
         )
 
-        output_lines.append(_header)
-        output_lines.append("-" * 150)
+        write(_header + "\n")
+        write(_SEP + "\n")
 
         # Print breakdown by basket
-        output_lines.append("Change by Basket:")
-        output_lines.append(f"  {'Basket':<35} {'Mark-to-Market':>15} {'Liquidation':>15} {'Total':>15}")
+        write("Change by Basket:\n")
+        write(f"  {'Basket':<35} {'Mark-to-Market':>15} {'Liquidation':>15} {'Total':>15}\n")
         grand_total_mtm = 0.0
         grand_total_liq = 0.0
         grand_total = 0.0
-        all_basket_ids = sorted(set(unrealized_by_basket.keys()) | set(liquidations_by_basket.keys()))
-        for basket_id in all_basket_ids:
+        for basket_id in _BASKET_IDS:
+            if basket_id not in unrealized_by_basket and basket_id not in liquidations_by_basket:
+                continue
             basket_name = BASKET_ACCOUNTS.get(basket_id, ('Unknown',))[0]
             mtm = unrealized_by_basket.get(basket_id, 0.0)
             liq = liquidations_by_basket.get(basket_id, 0.0)
@@ -564,90 +706,101 @@ class Holdings(object):
             grand_total_liq += liq
             grand_total += total
             liq_str = f"${liq:,.2f}" if liq else ""
-            output_lines.append(f"  {basket_id} ({basket_name}){'':<10} ${mtm:>12,.2f} {liq_str:>15} ${total:>12,.2f}")
-        output_lines.append(f"  {'Total':<35} ${grand_total_mtm:>12,.2f} ${grand_total_liq:>12,.2f} ${grand_total:>12,.2f}")
+            write(f"  {basket_id} ({basket_name}){'':<10} ${mtm:>12,.2f} {liq_str:>15} ${total:>12,.2f}\n")
+        write(f"  {'Total':<35} ${grand_total_mtm:>12,.2f} ${grand_total_liq:>12,.2f} ${grand_total:>12,.2f}\n")
 
-        output_lines.append("-" * 150)
+        write(_SEP + "\n")
 
         # Print detail by holding
-        output_lines.append(f"{'Symbol':<8} {'Basket':<8} {'Beg Value':>12} {'End Value':>12} {'Purchases':>12} {'Change':>12}")
-        output_lines.append("-" * 150)
+        write(f"{'Symbol':<8} {'Basket':<8} {'Beg Value':>12} {'End Value':>12} {'Purchases':>12} {'Change':>12}\n")
+        write(_SEP + "\n")
 
         total_beg = 0.0
         total_end = 0.0
         total_pur = 0.0
         total_chg = 0.0
 
-        for holding in sorted(self.holdings, key=lambda h: h.symbol):
+        # Bind the format templates once; a bound str.format call skips the
+        # per-row f-string spec parsing in the two table loops below.
+        fmt2 = "{:,.2f}".format
+        row_fmt = "{:<8} {:<8} {:>12} {:>12,.2f} {:>12} {:>12,.2f}\n".format
+
+        for holding in self._sorted_holdings:
             basket = SYMBOL_TO_BASKET.get(holding.symbol, '')
             beg_val = holding.beginning_value if holding.beginning_value is not None else holding.cost_basis
             purchases = self._purchases_by_symbol.get(holding.symbol, 0.0)
-            change = self._calculate_change(holding)
+            change = self._change_by_symbol[holding.symbol]
 
             total_beg += beg_val if beg_val else 0.0
             total_end += holding.ending_value
             total_pur += purchases
             total_chg += change
 
-            beg_str = f"{beg_val:,.2f}" if beg_val else ""
-            pur_str = f"{purchases:,.2f}" if purchases else ""
+            beg_str = fmt2(beg_val) if beg_val else ""
+            pur_str = fmt2(purchases) if purchases else ""
 
-            output_lines.append(
-                f"{holding.symbol:<8} {basket:<8} {beg_str:>12} {holding.ending_value:>12,.2f} {pur_str:>12} {change:>12,.2f}"
-            )
+            write(row_fmt(holding.symbol, basket, beg_str, holding.ending_value, pur_str, change))
 
         # Print liquidations (securities sold entirely during the period)
-        liquidations = self._get_liquidations()
-        period_changes = self._get_liquidation_period_change()
+        liquidations = self._liquidations
+        period_changes = self._liquidation_period_change
         if liquidations:
-            output_lines.append("")
-            output_lines.append("Liquidations (sold entirely):")
-            output_lines.append(f"{'Symbol':<8} {'Basket':<8} {'Prior End':>12} {'Proceeds':>12} {'Period Chg':>12} {'Cost Basis':>12} {'Realized':>12}")
+            write("\nLiquidations (sold entirely):\n")
+            write(f"{'Symbol':<8} {'Basket':<8} {'Prior End':>12} {'Proceeds':>12} {'Period Chg':>12} {'Cost Basis':>12} {'Realized':>12}\n")
             for symbol in sorted(liquidations.keys()):
                 basket = SYMBOL_TO_BASKET.get(symbol, '')
-                sale_data = self._sales_by_symbol[symbol]
-                cost_basis = sale_data['cost_basis']
-                proceeds = sale_data['proceeds']
+                cost_basis = self._sales_cost_basis[symbol]
+                proceeds = self._sales_proceeds[symbol]
                 realized_change = liquidations[symbol]
                 prior_end = self._prior_values.get(symbol, 0.0)
                 period_change = period_changes.get(symbol, 0.0)
                 total_beg += prior_end
                 total_end += proceeds
                 total_chg += period_change
-                output_lines.append(
-                    f"{symbol:<8} {basket:<8} {prior_end:>12,.2f} {proceeds:>12,.2f} {period_change:>12,.2f} {cost_basis:>12,.2f} {realized_change:>12,.2f}"
+                write(
+                    f"{symbol:<8} {basket:<8} {prior_end:>12,.2f} {proceeds:>12,.2f} {period_change:>12,.2f} {cost_basis:>12,.2f} {realized_change:>12,.2f}\n"
                 )
 
-        output_lines.append("-" * 150)
-        pur_total_str = f"{total_pur:,.2f}" if total_pur else ""
-        output_lines.append(f"{'Total':<8} {'':<8} {total_beg:>12,.2f} {total_end:>12,.2f} {pur_total_str:>12} {total_chg:>12,.2f}")
+        write(_SEP + "\n")
+        pur_total_str = fmt2(total_pur) if total_pur else ""
+        write(f"{'Total':<8} {'':<8} {total_beg:>12,.2f} {total_end:>12,.2f} {pur_total_str:>12} {total_chg:>12,.2f}\n")
 
         entries = self.journal_entries
 
-        output_lines.append(f"\n{'Date':<12} {'Journal #':<12} {'Description':<40} {'Account':<45} {'Debit':>12} {'Credit':>12}")
-        output_lines.append("-" * 150)
+        write(f"\n{'Date':<12} {'Journal #':<12} {'Description':<40} {'Account':<45} {'Debit':>12} {'Credit':>12}\n")
+        write(_SEP + "\n")
 
         if not entries:
-            output_lines.append("There are no journal entries.")
+            write("There are no journal entries.")
         else:
+            entry_fmt = "{:<12} {:<12} {:<40} {:<45} {:>12} {:>12}\n".format
             prev_journal_number = None
+            # Totals are folded into the emit loop so the entry list is
+            # traversed only once.
+            total_debit = 0.0
+            total_credit = 0.0
             for e in entries:
                 if prev_journal_number is not None and e.journal_number != prev_journal_number:
-                    output_lines.append("")
+                    write("\n")
                 prev_journal_number = e.journal_number
-                debit_str = f"{e.debit:,.2f}" if e.debit else ""
-                credit_str = f"{e.credit:,.2f}" if e.credit else ""
+                if e.debit:
+                    total_debit += e.debit
+                    debit_str = fmt2(e.debit)
+                else:
+                    debit_str = ""
+                if e.credit:
+                    total_credit += e.credit
+                    credit_str = fmt2(e.credit)
+                else:
+                    credit_str = ""
                 desc_display = e.description[:38] + ".." if e.description and len(e.description) > 40 else (e.description or "")
                 account_display = e.account[:43] + ".." if len(e.account) > 45 else e.account
-                output_lines.append(
-                    f"{str(e.journal_date):<12} {e.journal_number:<12} {desc_display:<40} {account_display:<45} {debit_str:>12} {credit_str:>12}"
-                )
-            output_lines.append("-" * 150)
-            total_debit = sum(e.debit for e in entries if e.debit)
-            total_credit = sum(e.credit for e in entries if e.credit)
-            output_lines.append(f"{'Total':<112} {total_debit:>12,.2f} {total_credit:>12,.2f}")
+                write(entry_fmt(str(e.journal_date), e.journal_number, desc_display, account_display, debit_str, credit_str))
+            write(_SEP + "\n")
+            # final line carries no trailing newline, matching the joined output
+            write(f"{'Total':<112} {total_debit:>12,.2f} {total_credit:>12,.2f}")
 
-        output = "\n".join(output_lines)
+        output = buf.getvalue()
         print(output)
 
         if log:
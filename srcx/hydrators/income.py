@@ -1,6 +1,10 @@
 import csv
-from csv import DictReader
+import math
+import sys
+from dataclasses import replace
 from datetime import date
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
 from typing import Iterator, Optional, Union
 from srcx.common.file_location import FileLocation
@@ -9,15 +13,54 @@ from srcx.datasets.journal_entry import JournalEntry
 from srcx.common.journal_writer import write_journal_entries
 from srcx.common.log_writer import write_log
 from collections import defaultdict
-
-
-class Income(object):
+import io
+
+
+# Invariant journal-entry fields, interned once at import; per-row entries are
+# stamped out with dataclasses.replace so only the varying fields are built.
+_JOURNAL_NUMBER_KEY = attrgetter('journal_number')
+_EMPTY = sys.intern('')
+_CASH_ACCOUNT = sys.intern('Cash - Fidelity Cash Management Account')
+_INCOME_ACCOUNT = sys.intern('Income - Ordinary Dividends')
+_ENTRY_TEMPLATE = JournalEntry(
+    journal_date=date.min,
+    reference_number=_EMPTY,
+    journal_number_prefix=sys.intern('MMW-'),
+    journal_number_suffix=_EMPTY,
+    notes=None,
+    journal_type=sys.intern('both'),
+    currency=sys.intern('USD'),
+    account=_CASH_ACCOUNT,
+    description=None,
+    contact_name=_EMPTY,
+    debit=None,
+    credit=None,
+    project_name=_EMPTY,
+    status=sys.intern('published'),
+    exchange_rate=_EMPTY,
+    account_code=None,
+)
+
+
+class Income:
     """
     Represents income data for a statement period.
 
     Hydrates from an INC CSV file which contains multiple records
     representing dividends, interest, and reinvestment transactions.
     """
+    __slots__ = (
+        '_file_location',
+        '_entries',
+        '_income_by_date',
+        '_income_entries',
+        '_total_income',
+        '_total_reinvestment',
+        '_sorted_dates',
+        '_symbols_str',
+        '_journal_entries',
+    )
+
     def __init__(self, file_location: FileLocation) -> None:
         """
         Initialize Income for a specific month and year.
@@ -31,28 +74,77 @@ class Income(object):
         if not csv_path.exists():
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader: DictReader[str] = csv.DictReader(f)
-            for row in reader:
-                if not any(row.values()):
-                    continue
-
-                entry = IncomeTransaction(
-                    settlement_date=date.fromisoformat(row['settlement_date']),
-                    security_name=row['security_name'],
-                    symbol=row['symbol'],
-                    cusip=row['cusip'],
-                    description=row['description'],
-                    quantity=float(row['quantity']) if row['quantity'] else None,
-                    price=float(row['price']) if row['price'] else None,
-                    amount=float(row['amount']),
-                )
-                self._entries.append(entry)
+        # One bulk read plus one decode beats the text layer's chunked
+        # decoding for these small monthly files; csv.reader then walks
+        # the in-memory line list with no file object in the loop.
+        data = csv_path.read_bytes().decode('utf-8')
+        reader = csv.reader(data.splitlines())
+        # csv.reader with a header-index map skips the per-row dict that
+        # DictReader builds; fields are converted straight from the row list.
+        headers = next(reader, None)
+        if headers is None:
+            raise ValueError(f"CSV file has no data rows: {csv_path}")
+        idx = {header: i for i, header in enumerate(headers)}
+        i_date = idx['settlement_date']
+        i_name = idx['security_name']
+        i_symbol = idx['symbol']
+        i_cusip = idx['cusip']
+        i_desc = idx['description']
+        i_quantity = idx['quantity']
+        i_price = idx['price']
+        i_amount = idx['amount']
+
+        # One fused pass: build entries, filter dividends, group them by
+        # date, and accumulate both totals without re-scanning the list.
+        self._income_by_date: defaultdict[date, list[IncomeTransaction]] = defaultdict(list)
+        self._income_entries: list[IncomeTransaction] = []
+        symbols_by_date: defaultdict[date, set[str]] = defaultdict(set)
+        reinvestment_amounts: list[float] = []
+
+        append = self._entries.append
+        income_append = self._income_entries.append
+        income_by_date = self._income_by_date
+        from_iso = date.fromisoformat
+        for row in reader:
+            if not row or not row[i_symbol]:
+                continue
+
+            settlement_date = from_iso(row[i_date])
+            description = row[i_desc]
+            amount = float(row[i_amount])
+            quantity = row[i_quantity]
+            price = row[i_price]
+            entry = IncomeTransaction(
+                settlement_date=settlement_date,
+                security_name=row[i_name],
+                symbol=row[i_symbol],
+                cusip=row[i_cusip],
+                description=description,
+                quantity=float(quantity) if quantity else None,
+                price=float(price) if price else None,
+                amount=amount,
+            )
+            append(entry)
+
+            if description == 'Dividend Received':
+                income_append(entry)
+                income_by_date[settlement_date].append(entry)
+                symbols_by_date[settlement_date].add(entry.symbol)
+            elif description == 'Reinvestment':
+                reinvestment_amounts.append(amount)
+
+        # Sort the distinct settlement dates once here so every later
+        # journal-entry build walks them pre-ordered, and render each date's
+        # symbol list once instead of per journal-entry build.
+        self._sorted_dates = sorted(self._income_by_date)
+        self._symbols_str = {
+            d: ', '.join(sorted(symbols)) for d, symbols in symbols_by_date.items()
+        }
 
-        # group transactions by date
-        self._income_by_date = defaultdict(list)
-        for txn in self.income:
-            self._income_by_date[txn.settlement_date].append(txn)
+        # math.fsum is exact regardless of accumulation order and runs in C;
+        # the lists are already in hand, so this replaces the running sums.
+        self._total_income = math.fsum(e.amount for e in self._income_entries)
+        self._total_reinvestment = abs(math.fsum(reinvestment_amounts))
 
     @property
     def year(self) -> int:
@@ -69,22 +161,29 @@ class Income(object):
     @property
     def income(self) -> list[IncomeTransaction]:
         """Return only dividend entries."""
-        return [e for e in self._entries if e.description == 'Dividend Received']
+        return self._income_entries
 
     @property
     def total_income(self) -> float:
         """Total of all positive income amounts (excludes reinvestment)."""
-        return sum(e.amount for e in self.income)
+        return self._total_income
 
     @property
     def total_reinvestment(self) -> float:
         """Total of all reinvestment amounts (negative values)."""
-        return abs(sum(e.amount for e in self._entries if e.description == 'Reinvestment'))
+        return self._total_reinvestment
 
     @property
     def journal_entries(self) -> Union[list[JournalEntry], None]:
+        # Slotted classes cannot host cached_property; an unassigned slot
+        # raising AttributeError serves as the not-yet-computed sentinel.
+        try:
+            return self._journal_entries
+        except AttributeError:
+            pass
 
         if not self._income_by_date:
+            self._journal_entries = None
             return None
         else:
             _return_value: list[JournalEntry] = []
@@ -92,56 +191,44 @@ class Income(object):
         #
         journal_number = 10001
 
-        for settlement_date in sorted(self._income_by_date.keys()):
+        for settlement_date in self._sorted_dates:
             txns = self._income_by_date[settlement_date]
             ref_number = f"DIV-{settlement_date}"
-            symbols = ', '.join(sorted(set(t.symbol for t in txns)))
+            jn_suffix = str(journal_number)
+            symbols = self._symbols_str[settlement_date]
             notes = f"{settlement_date} Dividends - {symbols}"
             total_amount = sum(t.amount for t in txns)
 
-            for txn in txns:
-                _row = JournalEntry(
-                    journal_date = settlement_date,
-                    reference_number =  ref_number,
-                    journal_number_prefix = 'MMW-',
-                    journal_number_suffix =  str(journal_number),
-                    notes =  notes,
-                    journal_type = 'both',
-                    currency = 'USD',
-                    account = 'Cash - Fidelity Cash Management Account',
-                    description = f"Dividend - {txn.symbol}",
-                    contact_name = '',
-                    debit = txn.amount,
-                    credit = None,
-                    project_name = '',
-                    status = 'published',
-                    exchange_rate = '',
-                    account_code=None
+            # Debit: Cash (one per dividend), batched as a single extend.
+            _return_value.extend(
+                replace(
+                    _ENTRY_TEMPLATE,
+                    journal_date=settlement_date,
+                    reference_number=ref_number,
+                    journal_number_suffix=jn_suffix,
+                    notes=notes,
+                    description=f"Dividend - {txn.symbol}",
+                    debit=txn.amount
                 )
-                _return_value.append(_row)
-
-            _row = JournalEntry(
-                journal_date = settlement_date,
-                reference_number =  ref_number,
-                journal_number_prefix = 'MMW-',
-                journal_number_suffix =  str(journal_number),
-                notes =  notes,
-                journal_type = 'both',
-                currency = 'USD',
-                account = 'Income - Ordinary Dividends',
-                description = f"Income - {symbols}",
-                contact_name = '',
-                debit = None,
-                credit = total_amount,
-                project_name = '',
-                status = 'published',
-                exchange_rate = '',
-                account_code = None
+                for txn in txns
+            )
+
+            # Credit: Income (total amount)
+            _row = replace(
+                _ENTRY_TEMPLATE,
+                journal_date=settlement_date,
+                reference_number=ref_number,
+                journal_number_suffix=jn_suffix,
+                notes=notes,
+                account=_INCOME_ACCOUNT,
+                description=f"Income - {symbols}",
+                credit=total_amount
             )
             _return_value.append(_row)
 
             journal_number += 1
 
+        self._journal_entries = _return_value
         return _return_value
 
     def write(self) -> dict[str, Optional[Path]]:
@@ -152,10 +239,13 @@ class Income(object):
 
     def pprint(self, log: bool = False) -> None:
 
-        output_lines: list[str] = []
+        # Stream into a single buffer rather than growing a list of lines and
+        # joining at the end; the per-entry loop is the hot path here.
+        buf = io.StringIO()
+        write = buf.write
 
-        output_lines.append(f"{self.__repr__()}")
-        output_lines.append("-" * 150)
+        write(f"{self.__repr__()}\n")
+        write("-" * 150 + "\n")
 
         _header = (
             f"Payment Count: {len(self.entries)}\n"
@@ -165,35 +255,47 @@ class Income(object):
             f"Dividend File: {self._file_location.dividend_file}"
         )
 
-        output_lines.append(_header)
-        output_lines.append("-" * 150)
+        write(_header + "\n")
+        write("-" * 150 + "\n")
 
         entries = self.journal_entries
 
-        output_lines.append(f"{'Date':<12} {'Journal #':<12} {'Description':<35} {'Account':<40} {'Debit':>12} {'Credit':>12}")
-        output_lines.append("-" * 150)
+        write(f"{'Date':<12} {'Journal #':<12} {'Description':<35} {'Account':<40} {'Debit':>12} {'Credit':>12}\n")
+        write("-" * 150 + "\n")
 
         if not entries:
-            output_lines.append("There are no journal entries.")
+            write("There are no journal entries.")
         else:
-            prev_journal_number = None
-            for e in entries:
-                if prev_journal_number is not None and e.journal_number != prev_journal_number:
-                    output_lines.append("")
-                prev_journal_number = e.journal_number
-                debit_str = f"{e.debit:,.2f}" if e.debit else ""
-                credit_str = f"{e.credit:,.2f}" if e.credit else ""
-                desc_display = e.description[:33] + ".." if e.description and len(e.description) > 35 else (e.description or "")
-                account_display = e.account[:38] + ".." if len(e.account) > 40 else e.account
-                output_lines.append(
-                    f"{str(e.journal_date):<12} {e.journal_number:<12} {desc_display:<35} {account_display:<40} {debit_str:>12} {credit_str:>12}"
-                )
-            output_lines.append("-" * 150)
-            total_debit = sum(e.debit for e in entries if e.debit)
-            total_credit = sum(e.credit for e in entries if e.credit)
-            output_lines.append(f"{'Total':<102} {total_debit:>12,.2f} {total_credit:>12,.2f}")
-
-        output = "\n".join(output_lines)
+            # Bind the formatters once; f-string formatting re-parses the spec
+            # per call while a bound format method does not.
+            fmt2 = "{:,.2f}".format
+            row_fmt = "{:<12} {:<12} {:<35} {:<40} {:>12} {:>12}\n".format
+            # Totals are accumulated in the same pass that formats the rows,
+            # so the entry list is only walked once. groupby recovers the
+            # journal grouping in C, so the separator branch leaves the loop.
+            total_debit = 0.0
+            total_credit = 0.0
+            for i, (journal_number, group) in enumerate(groupby(entries, key=_JOURNAL_NUMBER_KEY)):
+                if i:
+                    write("\n")
+                for e in group:
+                    if e.debit:
+                        total_debit += e.debit
+                        debit_str = fmt2(e.debit)
+                    else:
+                        debit_str = ""
+                    if e.credit:
+                        total_credit += e.credit
+                        credit_str = fmt2(e.credit)
+                    else:
+                        credit_str = ""
+                    desc_display = e.description[:33] + ".." if e.description and len(e.description) > 35 else (e.description or "")
+                    account_display = e.account[:38] + ".." if len(e.account) > 40 else e.account
+                    write(row_fmt(str(e.journal_date), journal_number, desc_display, account_display, debit_str, credit_str))
+            write("-" * 150 + "\n")
+            write(f"{'Total':<102} {total_debit:>12,.2f} {total_credit:>12,.2f}")
+
+        output = buf.getvalue()
         print(output)
 
         if log:
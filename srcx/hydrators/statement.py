@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from typing import Optional, Union
 from pathlib import Path
 import srcx.common as cmn
@@ -8,19 +10,27 @@ from srcx.hydrators import Holdings
 from srcx.datasets.journal_entry import JournalEntry
 from srcx.common.journal_writer import write_journal_entries
 
-class Statement(object):
+class Statement:
     """
     Represents account summary data for a statement period.
 
     Hydrates from a SUM CSV file which contains a single record with
     period and year-to-date account values.
     """
+    __slots__ = ('_file_location', '_summary', '_income', '_activity', '_holdings')
+
     def __init__(self, year: int, month: int) -> None:
         self._file_location = cmn.FileLocation(year=year, month=month, root='/Users/mick/GitHub/mjfii/mmm-accounting-agent-py')
-        self._summary = Summary(self._file_location)
-        self._income = Income(self._file_location)
-        self._activity = Activity(self._file_location)
-        self._holdings = Holdings(self._file_location)
+        # The four hydrators read independent files; overlap their blocking
+        # I/O on a small thread pool instead of loading them back to back.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(hydrator, self._file_location)
+                for hydrator in (Summary, Income, Activity, Holdings)
+            ]
+            self._summary, self._income, self._activity, self._holdings = [
+                future.result() for future in futures
+            ]
 
     @property
     def summary(self) -> Summary:
@@ -41,25 +51,20 @@ class Statement(object):
     @property
     def journal_entries(self) -> Union[list[JournalEntry], None]:
         """Aggregate all journal entries from income, activity, and holdings."""
-        all_entries: list[JournalEntry] = []
-
-        # Add dividend entries
-        if self.income.journal_entries:
-            all_entries.extend(self.income.journal_entries)
-
-        # Add purchase entries
-        if self.activity.purchase_journal_entries:
-            all_entries.extend(self.activity.purchase_journal_entries)
-
-        # Add sale entries
-        if self.activity.sale_journal_entries:
-            all_entries.extend(self.activity.sale_journal_entries)
-
-        # Add unrealized entries
-        if self.holdings.journal_entries:
-            all_entries.extend(self.holdings.journal_entries)
-
-        return all_entries if all_entries else None
+        # Bind each property once; the hydrators cache these lists but a
+        # local still saves the second descriptor call. chain.from_iterable
+        # concatenates the non-empty parts in C.
+        parts = [
+            entries
+            for entries in (
+                self.income.journal_entries,
+                self.activity.purchase_journal_entries,
+                self.activity.sale_journal_entries,
+                self.holdings.journal_entries,
+            )
+            if entries
+        ]
+        return list(chain.from_iterable(parts)) if parts else None
 
     def write(self) -> dict[str, Optional[Path]]:
         _return_value: dict[str, Optional[Path]] = {}
@@ -1,5 +1,5 @@
 import csv
-from csv import DictReader
+import math
 from datetime import date
 from pathlib import Path
 from srcx.common.file_location import FileLocation
@@ -12,7 +12,30 @@ class Summary:
 
     Hydrates from a SUM CSV file which contains a single record with
     period and year-to-date account values.
+
+    Parsed values are plain slotted attributes: access is a direct slot
+    read with no per-instance __dict__ and no property-descriptor call.
     """
+    __slots__ = (
+        '_file_location',
+        'period_start',
+        'period_end',
+        'beginning_value_period',
+        'additions_period',
+        'subtractions_period',
+        'change_investment_value_period',
+        'ending_value_period',
+        'beginning_value_ytd',
+        'additions_ytd',
+        'subtractions_ytd',
+        'change_investment_value_ytd',
+        'ending_value_ytd',
+        'income_period',
+        'income_ytd',
+        'unrealized_gains',
+        'validated',
+    )
+
     def __init__(self, file_location: FileLocation) -> None:
         """
         Initialize Summary for a specific month and year.
@@ -25,31 +48,53 @@ class Summary:
         if not csv_path.exists():
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader: DictReader[str] = csv.DictReader(f)
-            rows = [row for row in reader if any(row.values())]
-
-            if len(rows) == 0:
-                raise ValueError(f"CSV file has no data rows: {csv_path}")
-
-            if len(rows) > 1:
-                raise ValueError(f"CSV file has multiple data rows (expected 1): {csv_path}")
-
-            row = rows[0]
-            self._period_start = date.fromisoformat(row['period_start'])
-            self._period_end = date.fromisoformat(row['period_end'])
-            self._beginning_value_period = float(row['beginning_value_period'])
-            self._additions_period = float(row['additions_period'])
-            self._subtractions_period = float(row['subtractions_period'])
-            self._change_investment_value_period = float(row['change_investment_value_period'])
-            self._ending_value_period = float(row['ending_value_period'])
-            self._beginning_value_ytd = float(row['beginning_value_ytd'])
-            self._additions_ytd = float(row['additions_ytd'])
-            self._subtractions_ytd = float(row['subtractions_ytd'])
-            self._change_investment_value_ytd = float(row['change_investment_value_ytd'])
-            self._ending_value_ytd = float(row['ending_value_ytd'])
-            self._income_period = float(row['income_period'])
-            self._income_ytd = float(row['income_ytd'])
+        # One bulk read plus one decode; csv.reader walks the in-memory
+        # line list with no file object in the loop.
+        data = csv_path.read_bytes().decode('utf-8')
+        reader = csv.reader(data.splitlines())
+        # csv.reader with a header-index map: the single data row is
+        # converted positionally without building an intermediate dict.
+        headers = next(reader, None)
+        if headers is None:
+            raise ValueError(f"CSV file has no data rows: {csv_path}")
+        idx = {header: i for i, header in enumerate(headers)}
+
+        # The file holds exactly one data row: pull it with next() instead
+        # of materializing a list, then confirm nothing else follows.
+        row = next((r for r in reader if any(r)), None)
+        if row is None:
+            raise ValueError(f"CSV file has no data rows: {csv_path}")
+
+        if any(any(r) for r in reader):
+            raise ValueError(f"CSV file has multiple data rows (expected 1): {csv_path}")
+
+        self.period_start = date.fromisoformat(row[idx['period_start']])
+        self.period_end = date.fromisoformat(row[idx['period_end']])
+        self.beginning_value_period = float(row[idx['beginning_value_period']])
+        self.additions_period = float(row[idx['additions_period']])
+        self.subtractions_period = float(row[idx['subtractions_period']])
+        self.change_investment_value_period = float(row[idx['change_investment_value_period']])
+        self.ending_value_period = float(row[idx['ending_value_period']])
+        self.beginning_value_ytd = float(row[idx['beginning_value_ytd']])
+        self.additions_ytd = float(row[idx['additions_ytd']])
+        self.subtractions_ytd = float(row[idx['subtractions_ytd']])
+        self.change_investment_value_ytd = float(row[idx['change_investment_value_ytd']])
+        self.ending_value_ytd = float(row[idx['ending_value_ytd']])
+        self.income_period = float(row[idx['income_period']])
+        self.income_ytd = float(row[idx['income_ytd']])
+
+        # Derived values are fixed once parsing completes; compute them here
+        # so repeated access never re-runs the arithmetic.
+        self.unrealized_gains = self.change_investment_value_period - self.income_period
+        # Compare within a sub-cent tolerance: exact float equality would
+        # flag statements as invalid over pure summation rounding noise.
+        self.validated = math.isclose(
+            self.beginning_value_period + self.additions_period +
+            self.subtractions_period + self.income_period +
+            self.unrealized_gains,
+            self.ending_value_period,
+            abs_tol=1e-6,
+        )
 
     @property
     def year(self) -> int:
@@ -59,50 +104,6 @@ class Summary:
     def month(self) -> int:
         return self._file_location.month
 
-    @property
-    def period_start(self) -> date:
-        return self._period_start
-
-    @property
-    def period_end(self) -> date:
-        return self._period_end
-
-    @property
-    def beginning_value_period(self) -> float:
-        return self._beginning_value_period
-
-    @property
-    def additions_period(self) -> float:
-        return self._additions_period
-
-    @property
-    def subtractions_period(self) -> float:
-        return self._subtractions_period
-
-    @property
-    def change_investment_value_period(self) -> float:
-        return self._change_investment_value_period
-
-    @property
-    def ending_value_period(self) -> float:
-        return self._ending_value_period
-
-    @property
-    def income_period(self) -> float:
-        return self._income_period
-
-    @property
-    def unrealized_gains(self) -> float:
-        return self.change_investment_value_period - self.income_period
-
-    @property
-    def validated(self) -> bool:
-        if (self.beginning_value_period + self.additions_period +
-            self.subtractions_period + self.income_period +
-            self.unrealized_gains) == self.ending_value_period:
-            return True
-        else: return False
-
     def pprint(self, log: bool = False) -> None:
 
         output_lines: list[str] = []